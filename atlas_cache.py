@@ -0,0 +1,86 @@
+"""On-disk cache of Atlas GET responses for repeated read-only runs"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "atlas-importer"
+
+
+class CachingSession:
+    """Wrap a requests.Session and answer repeated GETs from an on-disk cache"""
+    
+    def __init__(self, session: requests.Session, ttl: float, cache_dir: Path = DEFAULT_CACHE_DIR):
+        self.session = session
+        self.ttl = ttl
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def __getattr__(self, name):
+        # Everything but GET goes straight to the wrapped session
+        return getattr(self.session, name)
+    
+    def get(self, url: str, params=None, **kwargs) -> requests.Response:
+        """GET through the cache; only successful responses are stored"""
+        path = self.cache_dir / f"{self._key(url, params)}.json"
+        
+        cached = self._read(path)
+        if cached is not None:
+            logger.debug(f"Cache hit: {url}")
+            return cached
+        
+        response = self.session.get(url, params=params, **kwargs)
+        if response.status_code == 200:
+            self._write(path, response)
+        return response
+    
+    def _key(self, url: str, params) -> str:
+        """Hash the user, URL and sorted query parameters into a cache key"""
+        if isinstance(params, dict):
+            params = sorted(params.items())
+        username = getattr(self.session.auth, "username", "")
+        raw = json.dumps([username, url, params], default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def _read(self, path: Path) -> Optional[requests.Response]:
+        """Return the cached response at path if it exists and is still fresh"""
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.url = entry["url"]
+        response.encoding = "utf-8"
+        response._content = entry["body"].encode("utf-8")
+        return response
+    
+    def _write(self, path: Path, response: requests.Response) -> None:
+        """Store a response atomically so concurrent readers never see partial files"""
+        entry = {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "url": response.url,
+            "body": response.text,
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Failed to write cache entry {path}: {str(e)}")
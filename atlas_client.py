@@ -1,53 +1,194 @@
 """Cloudera Atlas REST API client for glossary operations"""
 
+import hashlib
+import json
 import logging
-from typing import Dict, List, Tuple, Optional
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Set, Tuple, Optional, Union
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-from models import Glossary, Category, Term
+from urllib3.util.retry import Retry
+from models import Glossary, Category, Term, RELATIONSHIP_FIELD_PAIRS, parse_qualified_name, relationship_lists
+from relationship_graph import build_category_tree
 
 logger = logging.getLogger(__name__)
 
+# Optional entity attributes copied into request payloads when set, as
+# (payload field, model attribute) pairs in payload order
+_CATEGORY_OPTIONAL_FIELDS = (
+    ("shortDescription", "short_description"),
+    ("longDescription", "long_description"),
+)
+_TERM_OPTIONAL_FIELDS = (
+    ("shortDescription", "short_description"),
+    ("longDescription", "long_description"),
+    ("abbreviation", "abbreviation"),
+    ("steward", "steward"),
+)
+
+# Number of entities requested per page when listing existing glossary content,
+# and the most pages read from one collection before giving up on paging
+_PAGE_SIZE = 1000
+_MAX_PAGES = 1000
+
+
+def _iter_entities(data) -> Iterator[dict]:
+    """Yield entity dicts from any of the list/dict shapes Atlas returns for collections"""
+    if isinstance(data, list):
+        yield from data
+    elif isinstance(data, dict):
+        for field in ("categories", "terms", "entities", "value"):
+            entities = data.get(field)
+            if isinstance(entities, list):
+                yield from entities
+                return
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to every request it sends"""
+    
+    def __init__(self, *args, timeout: Optional[float] = None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def build_atlas_session(
+    username: str,
+    password: str,
+    verify_ssl: bool = True,
+    timeout: int = 30,
+    pool_maxsize: int = 32,
+    max_retries: Optional[Union[Retry, int]] = None,
+) -> requests.Session:
+    """Create an authenticated Atlas session that reuses keep-alive connections"""
+    if max_retries is None:
+        # Ride out brief gateway failures. The scripts only POST searches, so
+        # retrying POST is safe for them; AtlasClient passes its own policy.
+        max_retries = Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD", "DELETE", "POST"]),
+            raise_on_status=False,
+        )
+    
+    session = requests.Session()
+    session.auth = HTTPBasicAuth(username, password)
+    session.verify = verify_ssl
+    session.headers.update({"Content-Type": "application/json"})
+    
+    # requests has no session-wide timeout, so the adapter applies it
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+        timeout=timeout,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class AtlasClient:
     """REST client for Cloudera Atlas Glossary API"""
     
-    def __init__(self, base_url: str, username: str, password: str, verify_ssl: bool = True, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        verify_ssl: bool = True,
+        timeout: int = 30,
+        max_workers: int = 16,
+        batch_size: int = 200,
+    ):
         """Initialize Atlas client with connection details"""
         self.base_url = base_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.auth = HTTPBasicAuth(username, password)
-        self.session.verify = verify_ssl
-        self.session.timeout = timeout
-        self.session.headers.update({"Content-Type": "application/json"})
+        api = f"{self.base_url}/api/atlas/v2"
+        self._url_glossary = f"{api}/glossary"
+        self._url_category = f"{api}/glossary/category"
+        self._url_categories = f"{api}/glossary/categories"
+        self._url_terms = f"{api}/glossary/terms"
+        self._url_term_fmt = f"{api}/glossary/term/%s"
+        self._url_types = f"{api}/types/typedefs"
+        self._url_search = f"{api}/search/basic"
+        
+        # Independent requests are issued concurrently; size the connection
+        # pool so every worker thread keeps its own keep-alive socket.
+        # Only idempotent GETs are retried on transient gateway errors.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        self.session = build_atlas_session(
+            username,
+            password,
+            verify_ssl,
+            timeout,
+            pool_maxsize=max(64, max_workers),
+            max_retries=retry,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.batch_size = batch_size
+        
+        # Name -> GUID indexes of entities that already exist in Atlas, fetched
+        # once on the first 409 conflict instead of once per conflicting item
+        self._index_lock = threading.Lock()
+        self._glossary_index: Optional[Dict[str, str]] = None
+        self._category_index: Dict[str, Dict[str, str]] = {}
+        self._term_index: Dict[str, Dict[str, str]] = {}
+        # (glossary, term) pairs that a search already confirmed to be missing
+        self._term_miss: Set[Tuple[str, str]] = set()
         
         logger.info(f"Initialized AtlasClient for {self.base_url}")
     
+    def close(self) -> None:
+        """Stop the worker threads and close the pooled connections"""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+    
+    def __enter__(self) -> "AtlasClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def _handle_response(self, response: requests.Response, operation: str) -> Optional[Dict]:
         """Handle API response and raise exceptions for errors"""
-        try:
-            if response.status_code >= 400:
+        if response.status_code >= 400:
+            error_msg = response.text
+            if response.headers.get("Content-Type", "").startswith("application/json"):
                 try:
                     error_data = response.json()
-                    error_msg = error_data.get("errorMessage", response.text)
-                except:
-                    error_msg = response.text
-                
-                raise Exception(
-                    f"Atlas API error ({response.status_code}) during {operation}: {error_msg}"
-                )
-            
-            if response.status_code == 204:  # No content
-                return None
+                except ValueError:
+                    error_data = None
+                if isinstance(error_data, dict):
+                    error_msg = error_data.get("errorMessage", error_msg)
             
-            return response.json() if response.text else {}
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Network error during {operation}: {str(e)}")
+            raise Exception(
+                f"Atlas API error ({response.status_code}) during {operation}: {error_msg}"
+            )
+        
+        if response.status_code == 204:  # No content
+            return None
+        
+        return response.json() if response.content else {}
     
     def test_connection(self) -> bool:
         """Test connectivity to Atlas server"""
         try:
-            url = f"{self.base_url}/api/atlas/v2/types/typedefs"
+            url = self._url_types
             response = self.session.get(url)
             if response.status_code == 200:
                 logger.info("✓ Successfully connected to Atlas server")
@@ -61,154 +202,233 @@ class AtlasClient:
     
     def create_glossaries(self, glossaries: Dict[str, Glossary]) -> Dict[str, str]:
         """Create glossaries and return mapping of name -> GUID"""
-        import sys
         guid_map = {}
         
-        for gloss_name, glossary in glossaries.items():
-            try:
-                url = f"{self.base_url}/api/atlas/v2/glossary"
-                payload = {
-                    "name": glossary.name,
-                }
-                
-                # Log API call
-                import json
-                sys.stderr.write(f"\n→ POST {url}\n")
-                sys.stderr.write(f"  {json.dumps(payload, indent=2)}\n")
-                sys.stderr.flush()
-                
-                logger.debug(f"Creating glossary: {payload}")
-                response = self.session.post(url, json=payload)
-                
-                # Handle 409 (glossary already exists)
-                if response.status_code == 409:
-                    logger.info(f"ℹ Glossary '{gloss_name}' already exists, fetching GUID...")
-                    # Try to find the glossary by name
-                    guid = self._get_glossary_guid_by_name(gloss_name)
-                    if guid:
-                        guid_map[gloss_name] = guid
-                        glossary.guid = guid
-                        logger.info(f"✓ Found existing glossary '{gloss_name}' with GUID: {guid}")
-                        sys.stderr.write(f"  ← Found existing: {guid}\n")
-                        sys.stderr.flush()
-                        continue
-                    else:
-                        raise Exception(f"Glossary '{gloss_name}' exists but could not retrieve GUID")
-                
-                result = self._handle_response(response, f"create glossary '{gloss_name}'")
-                
-                if result:
-                    guid = result.get("guid")
-                    if guid:
-                        guid_map[gloss_name] = guid
-                        glossary.guid = guid
-                        logger.info(f"✓ Created glossary '{gloss_name}' with GUID: {guid}")
-                        sys.stderr.write(f"  ← Response: {guid}\n")
-                        sys.stderr.flush()
-                    else:
-                        logger.error(f"No GUID returned for glossary '{gloss_name}'")
-                        raise Exception(f"No GUID returned for glossary '{gloss_name}'")
-            except Exception as e:
-                logger.error(f"Failed to create glossary '{gloss_name}': {str(e)}")
-                raise
+        # Glossaries are independent of each other, so create them concurrently
+        names = list(glossaries.keys())
+        guids = self._executor.map(
+            lambda gloss_name: self._create_glossary(gloss_name, glossaries[gloss_name]),
+            names,
+        )
+        for gloss_name, guid in zip(names, guids):
+            if guid:
+                guid_map[gloss_name] = guid
         
         return guid_map
     
+    def _create_glossary(self, gloss_name: str, glossary: Glossary) -> Optional[str]:
+        """Create a single glossary (or find the existing one) and return its GUID"""
+        stderr_write, json_dumps = sys.stderr.write, json.dumps
+        try:
+            url = self._url_glossary
+            payload = {
+                "name": glossary.name,
+            }
+            
+            # Log API call; the serialized body is reused for the request itself
+            body = json_dumps(payload)
+            stderr_write(f"\n→ POST {url}\n  {body}\n")
+            
+            logger.debug("Creating glossary: %s", payload)
+            response = self.session.post(url, data=body)
+            
+            # Handle 409 (glossary already exists)
+            if response.status_code == 409:
+                logger.info(f"ℹ Glossary '{gloss_name}' already exists, fetching GUID...")
+                # Try to find the glossary by name
+                guid = self._get_glossary_guid_by_name(gloss_name)
+                if guid:
+                    glossary.guid = guid
+                    logger.info(f"✓ Found existing glossary '{gloss_name}' with GUID: {guid}")
+                    stderr_write(f"  ← Found existing: {gloss_name} = {guid}\n")
+                    return guid
+                else:
+                    raise Exception(f"Glossary '{gloss_name}' exists but could not retrieve GUID")
+            
+            result = self._handle_response(response, f"create glossary '{gloss_name}'")
+            
+            if result:
+                guid = result.get("guid")
+                if guid:
+                    glossary.guid = guid
+                    logger.info(f"✓ Created glossary '{gloss_name}' with GUID: {guid}")
+                    stderr_write(f"  ← Response: {gloss_name} = {guid}\n")
+                    return guid
+                else:
+                    logger.error(f"No GUID returned for glossary '{gloss_name}'")
+                    raise Exception(f"No GUID returned for glossary '{gloss_name}'")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to create glossary '{gloss_name}': {str(e)}")
+            raise
+    
     def create_categories(
         self,
         categories: Dict[Tuple[str, str], Category],
         glossary_guid_map: Dict[str, str]
     ) -> Dict[Tuple[str, str], str]:
         """Create categories in dependency order (parents first) and return mapping of (glossary, name) -> GUID"""
+        roots, children = build_category_tree(categories)
         guid_map = {}
-        processed = set()
         
-        def process_category(gloss_name: str, cat_name: str) -> Optional[str]:
-            """Process a category and its parent recursively"""
-            key = (gloss_name, cat_name)
-            
-            # Already processed
-            if key in processed:
-                return guid_map.get(key)
-            
+        # A category only depends on its parent, so each batch's children are
+        # submitted as soon as that batch returns instead of waiting for the
+        # whole level; independent subtrees proceed concurrently
+        pending = self._submit_categories(roots, categories, glossary_guid_map, guid_map)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            ready = []
+            for future in done:
+                guid_map.update(future.result())
+                ready.extend(child for key in pending.pop(future) for child in children.get(key, ()))
+            pending.update(self._submit_categories(ready, categories, glossary_guid_map, guid_map))
+        
+        return guid_map
+    
+    def _submit_categories(
+        self,
+        keys: List[Tuple[str, str]],
+        categories: Dict[Tuple[str, str], Category],
+        glossary_guid_map: Dict[str, str],
+        guid_map: Dict[Tuple[str, str], str]
+    ) -> Dict[Future, List[Tuple[str, str]]]:
+        """Submit categories whose parents exist in batch_size chunks and return each future's keys"""
+        payloads = []
+        for key in keys:
             category = categories[key]
             parent_guid = None
-            
-            # Process parent category first if it exists
             if category.parent_category_name:
-                parent_key = (gloss_name, category.parent_category_name)
-                if parent_key in categories:
-                    parent_guid = process_category(gloss_name, category.parent_category_name)
-                else:
-                    logger.error(f"Parent category not found: {gloss_name}.{category.parent_category_name}")
-                    raise Exception(f"Parent category not found: {gloss_name}.{category.parent_category_name}")
-            
-            # Create this category
+                parent_guid = guid_map.get((key[0], category.parent_category_name))
+            payloads.append(self._category_payload(category, glossary_guid_map[key[0]], parent_guid))
+        
+        futures = {}
+        batch_size = self.batch_size
+        for start in range(0, len(keys), batch_size):
+            chunk = keys[start:start + batch_size]
+            future = self._executor.submit(
+                self._post_categories_chunk, chunk, payloads[start:start + batch_size], categories
+            )
+            futures[future] = chunk
+        return futures
+    
+    def _category_payload(self, category: Category, glossary_guid: str, parent_guid: Optional[str]) -> Dict:
+        """Build the request body that creates a category"""
+        payload = {
+            "name": category.name,
+            "anchor": {"glossaryGuid": glossary_guid}
+        }
+        payload.update({
+            field: value
+            for field, attr in _CATEGORY_OPTIONAL_FIELDS
+            if (value := getattr(category, attr))
+        })
+        
+        if parent_guid:
+            payload["parentCategory"] = {"categoryGuid": parent_guid}
+        
+        return payload
+    
+    def _post_categories_chunk(
+        self,
+        keys: List[Tuple[str, str]],
+        payloads: List[Dict],
+        categories: Dict[Tuple[str, str], Category]
+    ) -> Dict[Tuple[str, str], str]:
+        """Create one batch of categories and return mapping of (glossary, name) -> GUID"""
+        stderr_write, json_dumps = sys.stderr.write, json.dumps
+        guid_map = {}
+        url = self._url_categories
+        
+        # Log API call; the serialized body is reused for the request itself
+        body = json_dumps(payloads)
+        stderr_write(f"\n→ POST {url} (batch: {len(payloads)} categories)\n  {body}\n")
+        
+        logger.debug("Creating %d categories", len(payloads))
+        response = self.session.post(url, data=body)
+        
+        # The bulk request is all-or-nothing, so if any category already exists
+        # (or the batch is rejected) each one is created on its own instead
+        results = None
+        if response.status_code != 409:
             try:
-                import sys, json
-                url = f"{self.base_url}/api/atlas/v2/glossary/category"
-                glossary_guid = glossary_guid_map[gloss_name]
-                
-                payload = {
-                    "name": category.name,
-                    "anchor": {"glossaryGuid": glossary_guid}
-                }
-                
-                if category.short_description:
-                    payload["shortDescription"] = category.short_description
-                if category.long_description:
-                    payload["longDescription"] = category.long_description
-                if parent_guid:
-                    payload["parentCategory"] = {"categoryGuid": parent_guid}
-                
-                # Log API call
-                sys.stderr.write(f"\n→ POST {url}\n")
-                sys.stderr.write(f"  {json.dumps(payload, indent=2)}\n")
-                sys.stderr.flush()
-                
-                logger.debug(f"Creating category: {payload}")
-                response = self.session.post(url, json=payload)
-                
-                # Handle 409 (category already exists)
-                if response.status_code == 409:
-                    logger.info(f"ℹ Category '{gloss_name}.{cat_name}' already exists, skipping...")
-                    # Generate a placeholder GUID - this is just for skipping existing categories
-                    # The actual relationships won't work with placeholder GUIDs
-                    import hashlib
-                    placeholder_guid = hashlib.md5(f"{gloss_name}.{cat_name}".encode()).hexdigest()[:8]
-                    placeholder_guid = f"{placeholder_guid}-skip-{placeholder_guid}"
-                    guid_map[key] = placeholder_guid
-                    processed.add(key)
-                    sys.stderr.write(f"  ← Skipped (already exists)\n")
-                    sys.stderr.flush()
-                    return placeholder_guid
-                
-                result = self._handle_response(response, f"create category '{gloss_name}.{cat_name}'")
-                
-                if result:
-                    guid = result.get("guid")
-                    if guid:
-                        guid_map[key] = guid
-                        category.guid = guid
-                        processed.add(key)
-                        logger.info(f"✓ Created category '{gloss_name}.{cat_name}' with GUID: {guid}")
-                        sys.stderr.write(f"  ← Response: {guid}\n")
-                        sys.stderr.flush()
-                        return guid
-                    else:
-                        logger.error(f"No GUID returned for category '{gloss_name}.{cat_name}'")
-                        raise Exception(f"No GUID returned for category '{gloss_name}.{cat_name}'")
+                results = self._handle_response(response, f"create {len(payloads)} categories")
             except Exception as e:
-                logger.error(f"Failed to create category '{gloss_name}.{cat_name}': {str(e)}")
-                raise
+                logger.warning(f"Bulk category creation failed ({str(e)}), creating one by one")
         
-        # Process all categories in dependency order
-        for (gloss_name, cat_name) in categories.keys():
-            if (gloss_name, cat_name) not in processed:
-                process_category(gloss_name, cat_name)
+        if not results:
+            for key, payload in zip(keys, payloads):
+                guid = self._create_category(key, categories[key], payload)
+                if guid:
+                    guid_map[key] = guid
+            return guid_map
+        
+        for key, result in zip(keys, results):
+            guid = result.get("guid")
+            if guid:
+                guid_map[key] = guid
+                categories[key].guid = guid
+                logger.info(f"✓ Created category '{key[0]}.{key[1]}' with GUID: {guid}")
+                stderr_write(f"  ← Response: {key[0]}.{key[1]} = {guid}\n")
+            else:
+                logger.error(f"No GUID returned for category '{key[0]}.{key[1]}'")
+                raise Exception(f"No GUID returned for category '{key[0]}.{key[1]}'")
         
         return guid_map
     
+    def _create_category(
+        self,
+        key: Tuple[str, str],
+        category: Category,
+        payload: Dict,
+    ) -> Optional[str]:
+        """Create a single category and return its GUID"""
+        gloss_name, cat_name = key
+        stderr_write, json_dumps = sys.stderr.write, json.dumps
+        try:
+            url = self._url_category
+            
+            # Log API call; the serialized body is reused for the request itself
+            body = json_dumps(payload)
+            stderr_write(f"\n→ POST {url}\n  {body}\n")
+            
+            logger.debug("Creating category: %s", payload)
+            response = self.session.post(url, data=body)
+            
+            # Handle 409 (category already exists)
+            if response.status_code == 409:
+                glossary_guid = payload["anchor"]["glossaryGuid"]
+                guid = self._get_category_guid_by_name(gloss_name, glossary_guid, cat_name)
+                if guid:
+                    category.guid = guid
+                    logger.info(f"✓ Found existing category '{gloss_name}.{cat_name}' with GUID: {guid}")
+                    stderr_write(f"  ← Found existing: {gloss_name}.{cat_name} = {guid}\n")
+                    return guid
+                
+                logger.info(f"ℹ Category '{gloss_name}.{cat_name}' already exists, skipping...")
+                # Generate a placeholder GUID - this is just for skipping existing categories
+                # The actual relationships won't work with placeholder GUIDs
+                placeholder_guid = hashlib.md5(f"{gloss_name}.{cat_name}".encode()).hexdigest()[:8]
+                placeholder_guid = f"{placeholder_guid}-skip-{placeholder_guid}"
+                stderr_write(f"  ← Skipped (already exists): {gloss_name}.{cat_name}\n")
+                return placeholder_guid
+            
+            result = self._handle_response(response, f"create category '{gloss_name}.{cat_name}'")
+            
+            if result:
+                guid = result.get("guid")
+                if guid:
+                    category.guid = guid
+                    logger.info(f"✓ Created category '{gloss_name}.{cat_name}' with GUID: {guid}")
+                    stderr_write(f"  ← Response: {gloss_name}.{cat_name} = {guid}\n")
+                    return guid
+                else:
+                    logger.error(f"No GUID returned for category '{gloss_name}.{cat_name}'")
+                    raise Exception(f"No GUID returned for category '{gloss_name}.{cat_name}'")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to create category '{gloss_name}.{cat_name}': {str(e)}")
+            raise
+    
     def create_terms(
         self,
         terms: Dict[Tuple[str, str], Term],
@@ -217,6 +437,7 @@ class AtlasClient:
     ) -> Dict[Tuple[str, str], str]:
         """Create terms and return mapping of (glossary, name) -> GUID"""
         guid_map = {}
+        futures = []
         
         # Group terms by glossary for batch creation
         terms_by_glossary: Dict[str, List[Tuple[Tuple[str, str], Term]]] = {}
@@ -226,97 +447,137 @@ class AtlasClient:
                 terms_by_glossary[gloss_name] = []
             terms_by_glossary[gloss_name].append((key, term))
         
+        # Flatten category GUIDs per glossary so term payloads look up by name alone
+        categories_by_glossary: Dict[str, Dict[str, str]] = {}
+        for (gloss_name, cat_name), cat_guid in category_guid_map.items():
+            categories_by_glossary.setdefault(gloss_name, {})[cat_name] = cat_guid
+        
         # Create terms for each glossary
         for gloss_name, gloss_terms in terms_by_glossary.items():
             try:
-                import sys, json
-                url = f"{self.base_url}/api/atlas/v2/glossary/terms"
                 glossary_guid = glossary_guid_map[gloss_name]
+                local_cat = categories_by_glossary.get(gloss_name, {})
+                term_keys = [key for key, _ in gloss_terms]
                 
-                payloads = []
-                term_keys = []
-                
-                for key, term in gloss_terms:
-                    payload = {
-                        "name": term.name,
-                        "anchor": {"glossaryGuid": glossary_guid},
-                        "status": term.status
-                    }
-                    
-                    if term.short_description:
-                        payload["shortDescription"] = term.short_description
-                    if term.long_description:
-                        payload["longDescription"] = term.long_description
-                    if term.abbreviation:
-                        payload["abbreviation"] = term.abbreviation
-                    if term.steward:
-                        payload["steward"] = term.steward
-                    if term.examples:
-                        payload["examples"] = term.examples.split(",") if isinstance(term.examples, str) else term.examples
-                    
-                    # Add category associations
-                    if term.category_names:
-                        category_guids = []
-                        for cat_name in term.category_names:
-                            cat_key = (gloss_name, cat_name)
-                            if cat_key in category_guid_map:
-                                category_guids.append({"categoryGuid": category_guid_map[cat_key]})
-                        if category_guids:
-                            payload["categories"] = category_guids
-                    
-                    payloads.append(payload)
-                    term_keys.append(key)
-                
-                if payloads:
-                    # Log API call
-                    sys.stderr.write(f"\n→ POST {url} (batch: {len(payloads)} terms)\n")
-                    sys.stderr.write(f"  {json.dumps(payloads, indent=2)}\n")
-                    sys.stderr.flush()
-                    
-                    logger.debug(f"Creating {len(payloads)} terms for glossary '{gloss_name}'")
-                    response = self.session.post(url, json=payloads)
-                    
-                    # Handle 409 (terms already exist) - fetch existing GUIDs
-                    if response.status_code == 409:
-                        logger.info(f"ℹ Some terms in glossary '{gloss_name}' already exist, fetching GUIDs...")
-                        for key, term in zip(term_keys, payloads):
-                            guid = self._get_term_guid_by_name(gloss_name, term["name"])
-                            if guid:
-                                guid_map[key] = guid
-                                terms[key].guid = guid
-                                logger.info(f"✓ Found existing term '{key[0]}.{key[1]}' with GUID: {guid}")
-                                sys.stderr.write(f"  ← Found existing: {key[0]}.{key[1]} = {guid}\n")
-                                sys.stderr.flush()
-                            else:
-                                logger.warning(f"Could not fetch GUID for existing term '{key[0]}.{key[1]}'")
-                    else:
-                        results = self._handle_response(response, f"create terms for glossary '{gloss_name}'")
-                        
-                        if results:
-                            for i, result in enumerate(results):
-                                guid = result.get("guid")
-                                if guid:
-                                    key = term_keys[i]
-                                    guid_map[key] = guid
-                                    terms[key].guid = guid
-                                    logger.info(f"✓ Created term '{key[0]}.{key[1]}' with GUID: {guid}")
-                                    sys.stderr.write(f"  ← Response: {key[0]}.{key[1]} = {guid}\n")
-                                    sys.stderr.flush()
-                            else:
-                                key = term_keys[i]
-                                logger.error(f"No GUID returned for term '{key[0]}.{key[1]}'")
+                # Post fixed-size sub-batches concurrently so no single request
+                # outgrows the server's request size limit. Each worker builds
+                # its own chunk's payloads, so only in-flight chunks are held in memory.
+                batch_size = self.batch_size
+                for start in range(0, len(term_keys), batch_size):
+                    futures.append(self._executor.submit(
+                        self._post_terms_chunk,
+                        gloss_name,
+                        term_keys[start:start + batch_size],
+                        glossary_guid,
+                        local_cat,
+                        terms,
+                    ))
             except Exception as e:
                 logger.error(f"Failed to create terms for glossary '{gloss_name}': {str(e)}")
                 raise
         
+        wait(futures)
+        for future in futures:
+            guid_map.update(future.result())
+        
+        return guid_map
+    
+    def _term_payload(self, term: Term, anchor: Dict, local_cat: Dict[str, str]) -> Dict:
+        """Build the request body that creates a term"""
+        examples = term.examples
+        category_names = term.category_names
+        
+        payload = {
+            "name": term.name,
+            "anchor": anchor,
+            "status": term.status
+        }
+        payload.update({
+            field: value
+            for field, attr in _TERM_OPTIONAL_FIELDS
+            if (value := getattr(term, attr))
+        })
+        
+        if examples:
+            payload["examples"] = examples.split(",") if isinstance(examples, str) else examples
+        
+        # Add category associations
+        if category_names:
+            category_guids = [
+                {"categoryGuid": local_cat[cat_name]}
+                for cat_name in category_names
+                if cat_name in local_cat
+            ]
+            if category_guids:
+                payload["categories"] = category_guids
+        
+        return payload
+    
+    def _post_terms_chunk(
+        self,
+        gloss_name: str,
+        term_keys: List[Tuple[str, str]],
+        glossary_guid: str,
+        local_cat: Dict[str, str],
+        terms: Dict[Tuple[str, str], Term]
+    ) -> Dict[Tuple[str, str], str]:
+        """Create one batch of terms of a glossary and return mapping of (glossary, name) -> GUID"""
+        stderr_write, json_dumps = sys.stderr.write, json.dumps
+        guid_map = {}
+        try:
+            url = self._url_terms
+            anchor = {"glossaryGuid": glossary_guid}
+            payloads = [self._term_payload(terms[key], anchor, local_cat) for key in term_keys]
+            
+            # Log API call; the serialized body is reused for the request itself
+            body = json_dumps(payloads)
+            stderr_write(f"\n→ POST {url} (batch: {len(payloads)} terms)\n  {body}\n")
+            
+            logger.debug("Creating %d terms for glossary '%s'", len(payloads), gloss_name)
+            response = self.session.post(url, data=body)
+            
+            # Handle 409 (terms already exist) - fetch existing GUIDs
+            if response.status_code == 409:
+                logger.info(f"ℹ Some terms in glossary '{gloss_name}' already exist, fetching GUIDs...")
+                for key, payload in zip(term_keys, payloads):
+                    guid = self._get_term_guid_by_name(gloss_name, glossary_guid, payload["name"])
+                    if guid:
+                        guid_map[key] = guid
+                        terms[key].guid = guid
+                        logger.info(f"✓ Found existing term '{key[0]}.{key[1]}' with GUID: {guid}")
+                        stderr_write(f"  ← Found existing: {key[0]}.{key[1]} = {guid}\n")
+                    else:
+                        logger.warning(f"Could not fetch GUID for existing term '{key[0]}.{key[1]}'")
+            else:
+                results = self._handle_response(response, f"create terms for glossary '{gloss_name}'")
+                
+                if results:
+                    for key, result in zip(term_keys, results):
+                        guid = result.get("guid")
+                        if guid:
+                            guid_map[key] = guid
+                            terms[key].guid = guid
+                            logger.info(f"✓ Created term '{key[0]}.{key[1]}' with GUID: {guid}")
+                            stderr_write(f"  ← Response: {key[0]}.{key[1]} = {guid}\n")
+                        else:
+                            logger.error(f"No GUID returned for term '{key[0]}.{key[1]}'")
+        except Exception as e:
+            logger.error(f"Failed to create terms for glossary '{gloss_name}': {str(e)}")
+            raise
+        
         return guid_map
     
     def update_term_relationships(
         self,
         term_guid_map: Dict[Tuple[str, str], str],
-        terms: Dict[Tuple[str, str], Term]
+        terms: Dict[Tuple[str, str], Term],
+        target_keys: Optional[Dict[str, Tuple[str, str]]] = None
     ) -> None:
         """Update term relationships by fetching full term object and updating with relationships"""
+        # Keys resolved by the graph builder are exact even when a glossary or term
+        # name contains a dot; only references it never saw are parsed
+        target_keys = target_keys or {}
+        term_refs = self._build_term_refs(terms, term_guid_map, target_keys)
         for key, term in terms.items():
             if key not in term_guid_map:
                 logger.warning(f"Term '{key[0]}.{key[1]}' not found in GUID map, skipping relationship update")
@@ -325,82 +586,106 @@ class AtlasClient:
             term_guid = term_guid_map[key]
             
             # Only process if term has relationships
-            has_relationships = (
-                term.synonyms or term.antonyms or term.related_terms or 
-                term.preferred_terms or term.replacement_terms or term.see_also or 
-                term.is_a or term.classifies
-            )
-            
-            if not has_relationships:
+            if not any(relationship_lists(term)):
                 continue
             
-            try:
-                import sys, json
-                
-                # Fetch current term from Atlas
-                fetch_url = f"{self.base_url}/api/atlas/v2/glossary/term/{term_guid}"
-                logger.debug(f"Fetching current term {term_guid} from Atlas...")
-                fetch_response = self.session.get(fetch_url)
-                current_term = self._handle_response(fetch_response, f"fetch term '{key[0]}.{key[1]}'")
-                
-                if not current_term:
-                    logger.warning(f"Could not fetch term '{key[0]}.{key[1]}' from Atlas, skipping relationships")
+            # Updates run one at a time: each is a read-modify-write of the whole
+            # term, and Atlas adds inverse edges (e.g. classifies for isA) to the
+            # target, so a concurrent update of that target could PUT a stale
+            # snapshot without the new edge and drop it
+            self._update_term_relationships(key, term, term_guid, term_guid_map, term_refs, target_keys)
+    
+    def _build_term_refs(
+        self,
+        terms: Dict[Tuple[str, str], Term],
+        term_guid_map: Dict[Tuple[str, str], str],
+        target_keys: Dict[str, Tuple[str, str]]
+    ) -> Dict[str, Dict[str, str]]:
+        """Map every resolvable qualified name referenced by the terms to its relationship payload"""
+        term_refs: Dict[str, Dict[str, str]] = {}
+        for term in terms.values():
+            for qualified_name in term.iter_all_refs():
+                if qualified_name in term_refs:
                     continue
-                
-                # Build relationship updates
-                if term.synonyms:
-                    current_term["synonyms"] = [{"termGuid": self._resolve_term_guid(syn, term_guid_map), "displayName": self._extract_term_name(syn)} for syn in term.synonyms]
-                if term.antonyms:
-                    current_term["antonyms"] = [{"termGuid": self._resolve_term_guid(ant, term_guid_map), "displayName": self._extract_term_name(ant)} for ant in term.antonyms]
-                if term.related_terms:
-                    current_term["relatedTerms"] = [{"termGuid": self._resolve_term_guid(rel, term_guid_map), "displayName": self._extract_term_name(rel)} for rel in term.related_terms]
-                if term.preferred_terms:
-                    current_term["preferredTerms"] = [{"termGuid": self._resolve_term_guid(pref, term_guid_map), "displayName": self._extract_term_name(pref)} for pref in term.preferred_terms]
-                if term.replacement_terms:
-                    current_term["replacementTerms"] = [{"termGuid": self._resolve_term_guid(repl, term_guid_map), "displayName": self._extract_term_name(repl)} for repl in term.replacement_terms]
-                if term.see_also:
-                    current_term["seeAlso"] = [{"termGuid": self._resolve_term_guid(see, term_guid_map), "displayName": self._extract_term_name(see)} for see in term.see_also]
-                if term.is_a:
-                    current_term["isA"] = [{"termGuid": self._resolve_term_guid(isa, term_guid_map), "displayName": self._extract_term_name(isa)} for isa in term.is_a]
-                if term.classifies:
-                    current_term["classifies"] = [{"termGuid": self._resolve_term_guid(cls, term_guid_map), "displayName": self._extract_term_name(cls)} for cls in term.classifies]
-                
-                # Update term with relationships
-                url = f"{self.base_url}/api/atlas/v2/glossary/term/{term_guid}"
-                
-                # Log API call
-                sys.stderr.write(f"\n→ PUT {url}\n")
-                sys.stderr.write(f"  {json.dumps(current_term, indent=2)}\n")
-                sys.stderr.flush()
-                
-                logger.debug(f"Updating relationships for term {term_guid}")
-                response = self.session.put(url, json=current_term)
-                self._handle_response(response, f"update relationships for term '{key[0]}.{key[1]}'")
-                logger.info(f"✓ Updated relationships for term '{key[0]}.{key[1]}'")
-                
-                sys.stderr.write(f"  ← Response: Updated\n")
-                sys.stderr.flush()
-            except Exception as e:
-                logger.error(f"Failed to update relationships for term '{key[0]}.{key[1]}': {str(e)}")
-                raise
+                key = target_keys.get(qualified_name) or parse_qualified_name(qualified_name)
+                guid = term_guid_map.get(key) if key is not None else None
+                if guid:
+                    term_refs[qualified_name] = {
+                        "termGuid": guid,
+                        "displayName": key[1],
+                    }
+        return term_refs
+    
+    def _term_ref(
+        self,
+        qualified_name: str,
+        term_guid_map: Dict[Tuple[str, str], str],
+        target_keys: Dict[str, Tuple[str, str]]
+    ) -> Dict[str, str]:
+        """Build a relationship payload for a qualified name missing from the precomputed refs"""
+        return {
+            "termGuid": self._resolve_term_guid(qualified_name, term_guid_map, target_keys),
+            "displayName": self._extract_term_name(qualified_name),
+        }
     
-    def _resolve_term_guid(self, qualified_name: str, term_guid_map: Dict[Tuple[str, str], str]) -> str:
+    def _update_term_relationships(
+        self,
+        key: Tuple[str, str],
+        term: Term,
+        term_guid: str,
+        term_guid_map: Dict[Tuple[str, str], str],
+        term_refs: Dict[str, Dict[str, str]],
+        target_keys: Dict[str, Tuple[str, str]]
+    ) -> None:
+        """Fetch a single term from Atlas and update it with its relationships"""
+        stderr_write, json_dumps = sys.stderr.write, json.dumps
+        ref = term_refs.get
+        try:
+            # Fetch current term from Atlas
+            url = self._url_term_fmt % term_guid
+            logger.debug("Fetching current term %s from Atlas...", term_guid)
+            fetch_response = self.session.get(url)
+            current_term = self._handle_response(fetch_response, f"fetch term '{key[0]}.{key[1]}'")
+            
+            if not current_term:
+                logger.warning(f"Could not fetch term '{key[0]}.{key[1]}' from Atlas, skipping relationships")
+                return
+            
+            # Build relationship updates
+            for field, attr in RELATIONSHIP_FIELD_PAIRS:
+                qualified_names = getattr(term, attr)
+                if qualified_names:
+                    current_term[field] = [
+                        ref(qualified_name) or self._term_ref(qualified_name, term_guid_map, target_keys)
+                        for qualified_name in qualified_names
+                    ]
+            
+            # Update term with relationships at the URL it was fetched from.
+            # Log API call; the serialized body is reused for the request itself
+            body = json_dumps(current_term)
+            stderr_write(f"\n→ PUT {url}\n  {body}\n")
+            
+            logger.debug("Updating relationships for term %s", term_guid)
+            response = self.session.put(url, data=body)
+            self._handle_response(response, f"update relationships for term '{key[0]}.{key[1]}'")
+            logger.info(f"✓ Updated relationships for term '{key[0]}.{key[1]}'")
+            
+            stderr_write(f"  ← Response: Updated {key[0]}.{key[1]}\n")
+        except Exception as e:
+            logger.error(f"Failed to update relationships for term '{key[0]}.{key[1]}': {str(e)}")
+            raise
+
+    def _resolve_term_guid(
+        self,
+        qualified_name: str,
+        term_guid_map: Dict[Tuple[str, str], str],
+        target_keys: Dict[str, Tuple[str, str]]
+    ) -> str:
         """Resolve a qualified name to its GUID"""
-        # Parse qualified name: "glossary.termname@glossary"
-        if "@" not in qualified_name:
-            raise ValueError(f"Invalid qualified name format: {qualified_name}")
-        
-        qualified, realm = qualified_name.split("@")
-        parts = qualified.split(".")
-        
-        if len(parts) < 2:
+        key = target_keys.get(qualified_name) or parse_qualified_name(qualified_name)
+        if key is None:
             raise ValueError(f"Invalid qualified name format: {qualified_name}")
         
-        # The glossary is the first part, term name is the last part
-        glossary_name = parts[0]
-        term_name = parts[-1]
-        
-        key = (glossary_name, term_name)
         if key not in term_guid_map:
             raise ValueError(f"Term GUID not found for: {qualified_name} (key: {key})")
         
@@ -408,7 +693,11 @@ class AtlasClient:
     
     def _extract_term_name(self, qualified_name: str) -> str:
         """Extract term name from qualified name"""
-        # Parse qualified name: "glossary.termname@glossary"
+        key = parse_qualified_name(qualified_name)
+        if key is not None:
+            return key[1]
+        
+        # Not in "glossary.termname@glossary" form
         if "@" not in qualified_name:
             return qualified_name
         
@@ -420,83 +709,126 @@ class AtlasClient:
     
     def _get_glossary_guid_by_name(self, glossary_name: str) -> Optional[str]:
         """Get GUID for an existing glossary by name"""
+        with self._index_lock:
+            if self._glossary_index is None:
+                self._glossary_index = self._fetch_all_glossaries()
+            return self._glossary_index.get(glossary_name)
+    
+    def _fetch_all_glossaries(self) -> Dict[str, str]:
+        """Fetch all existing glossaries once and return mapping of name -> GUID"""
         try:
-            url = f"{self.base_url}/api/atlas/v2/glossary"
-            response = self.session.get(url)
-            if response.status_code == 200:
-                glossaries = response.json()
-                if isinstance(glossaries, list):
-                    for glossary in glossaries:
-                        if glossary.get("name") == glossary_name:
-                            return glossary.get("guid")
-            return None
+            return self._fetch_name_index(self._url_glossary)
         except Exception as e:
-            logger.warning(f"Failed to fetch glossary GUID for '{glossary_name}': {str(e)}")
-            return None
+            logger.warning(f"Failed to fetch existing glossaries: {str(e)}")
+            return {}
+    
+    def _fetch_name_index(self, url: str) -> Dict[str, str]:
+        """Page through a collection endpoint and return mapping of name -> GUID"""
+        index: Dict[str, str] = {}
+        offset = 0
+        for _ in range(_MAX_PAGES):
+            response = self.session.get(url, params={"limit": _PAGE_SIZE, "offset": offset})
+            if response.status_code != 200:
+                return index
+            
+            count = 0
+            known = len(index)
+            for entity in _iter_entities(response.json()):
+                index[entity.get("name")] = entity.get("guid")
+                count += 1
+            logger.debug("Fetched %d entities from %s (offset %d)", count, url, offset)
+            
+            # A short page is the last one; a page larger than requested means
+            # the server ignored the limit and already returned everything, and
+            # a page adding no new names means it ignored the offset
+            if count != _PAGE_SIZE or len(index) == known:
+                return index
+            offset += count
+        
+        logger.warning(f"Stopped paging {url} after {_MAX_PAGES} pages")
+        return index
     
-    def _get_category_guid_by_name(self, glossary_name: str, category_name: str) -> Optional[str]:
+    def _get_category_guid_by_name(
+        self,
+        glossary_name: str,
+        glossary_guid: str,
+        category_name: str
+    ) -> Optional[str]:
         """Get GUID for an existing category by glossary and category name"""
+        with self._index_lock:
+            if glossary_name not in self._category_index:
+                self._category_index[glossary_name] = self._fetch_all_categories(glossary_name, glossary_guid)
+            return self._category_index[glossary_name].get(category_name)
+    
+    def _fetch_all_categories(self, glossary_name: str, glossary_guid: str) -> Dict[str, str]:
+        """Fetch a glossary's existing categories once and return mapping of name -> GUID"""
         try:
-            # Try to get from glossary-specific endpoint
-            url = f"{self.base_url}/api/atlas/v2/glossary/{glossary_name}/categories"
-            logger.debug(f"Attempting to fetch category from: {url}")
-            response = self.session.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                logger.debug(f"Response from glossary-specific endpoint: {data}")
-                if isinstance(data, list):
-                    for category in data:
-                        if category.get("name") == category_name:
-                            return category.get("guid")
-                elif isinstance(data, dict):
-                    if "categories" in data:
-                        for category in data["categories"]:
-                            if category.get("name") == category_name:
-                                return category.get("guid")
-                    elif "entities" in data:
-                        for category in data["entities"]:
-                            if category.get("name") == category_name:
-                                return category.get("guid")
-                    elif "value" in data:
-                        categories = data["value"]
-                        if isinstance(categories, list):
-                            for category in categories:
-                                if category.get("name") == category_name:
-                                    return category.get("guid")
-            return None
+            # The glossary-specific endpoint is addressed by GUID, not by name
+            url = f"{self._url_glossary}/{glossary_guid}/categories"
+            logger.debug("Attempting to fetch categories from: %s", url)
+            return self._fetch_name_index(url)
         except Exception as e:
-            logger.debug(f"Failed to fetch category GUID for '{glossary_name}.{category_name}': {str(e)}")
-            return None
+            logger.debug("Failed to fetch categories for glossary '%s': %s", glossary_name, e)
+            return {}
     
-    def _get_term_guid_by_name(self, glossary_name: str, term_name: str) -> Optional[str]:
+    def _get_term_guid_by_name(self, glossary_name: str, glossary_guid: str, term_name: str) -> Optional[str]:
         """Get GUID for an existing term by glossary and term name"""
+        guid = self._get_glossary_terms(glossary_name, glossary_guid).get(term_name)
+        if guid:
+            return guid
+        return self._search_term_guid(glossary_name, term_name)
+    
+    def _get_glossary_terms(self, glossary_name: str, glossary_guid: str) -> Dict[str, str]:
+        """Return the cached mapping of name -> GUID for a glossary's existing terms"""
+        with self._index_lock:
+            if glossary_name not in self._term_index:
+                self._term_index[glossary_name] = self._fetch_all_terms(glossary_name, glossary_guid)
+            return self._term_index[glossary_name]
+    
+    def _fetch_all_terms(self, glossary_name: str, glossary_guid: str) -> Dict[str, str]:
+        """Fetch a glossary's existing terms once and return mapping of name -> GUID"""
         try:
-            # Try to get from glossary-specific endpoint
-            url = f"{self.base_url}/api/atlas/v2/glossary/{glossary_name}/terms"
-            response = self.session.get(url)
-            if response.status_code == 200:
-                terms = response.json()
-                if isinstance(terms, list):
-                    for term in terms:
-                        if term.get("name") == term_name:
-                            return term.get("guid")
-                elif isinstance(terms, dict) and "entities" in terms:
-                    for term in terms["entities"]:
-                        if term.get("name") == term_name:
-                            return term.get("guid")
-            
-            # Fallback: try generic endpoint
-            url = f"{self.base_url}/api/atlas/v2/glossary/terms"
-            response = self.session.get(url)
+            # The glossary-specific endpoint is addressed by GUID, not by name
+            url = f"{self._url_glossary}/{glossary_guid}/terms"
+            return self._fetch_name_index(url)
+        except Exception as e:
+            logger.warning(f"Failed to fetch terms for glossary '{glossary_name}': {str(e)}")
+            return {}
+    
+    def _search_term_guid(self, glossary_name: str, term_name: str) -> Optional[str]:
+        """Look up a term GUID through a server-side basic search"""
+        key = (glossary_name, term_name)
+        if key in self._term_miss:
+            return None
+        try:
+            url = self._url_search
+            # Atlas qualifies glossary terms as "<term>@<glossary>"
+            query = {
+                "typeName": "AtlasGlossaryTerm",
+                "excludeDeletedEntities": True,
+                "entityFilters": {
+                    "condition": "AND",
+                    "criterion": [
+                        {"attributeName": "name", "operator": "eq", "attributeValue": term_name},
+                        {"attributeName": "qualifiedName", "operator": "eq",
+                         "attributeValue": f"{term_name}@{glossary_name}"},
+                    ],
+                },
+                "limit": 1,
+            }
+            response = self.session.post(url, data=json.dumps(query))
             if response.status_code == 200:
-                terms = response.json()
-                if isinstance(terms, list):
-                    for term in terms:
-                        if (term.get("name") == term_name and 
-                            term.get("anchor", {}).get("glossaryName") == glossary_name):
-                            return term.get("guid")
+                entities = response.json().get("entities") or []
+                guid = entities[0].get("guid") if entities else None
+                if guid:
+                    # Remember the hit so later lookups are answered from the index
+                    with self._index_lock:
+                        index = self._term_index.get(glossary_name)
+                        if index is not None:
+                            index[term_name] = guid
+                    return guid
+                self._term_miss.add(key)
             return None
         except Exception as e:
             logger.warning(f"Failed to fetch term GUID for '{glossary_name}.{term_name}': {str(e)}")
             return None
-
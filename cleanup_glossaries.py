@@ -8,10 +8,11 @@ Use this to reset your Atlas instance before re-importing.
 
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, Tuple
 import click
+from atlas_client import build_atlas_session
 from config import Config
-import requests
-from requests.auth import HTTPBasicAuth
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,66 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
+# GUIDs per bulk delete request, keeping the query string under URL length limits
+_BULK_DELETE_BATCH = 100
+
+
+def _bulk_delete_glossaries(session, base_url: str, glossaries: List[dict]) -> Set[str]:
+    """Delete glossaries in batched bulk entity requests and return the GUIDs Atlas reports as deleted"""
+    guids = [g.get("guid", g.get("id")) for g in glossaries]
+    guids = [guid for guid in guids if guid]
+    if not guids:
+        return set()
+    
+    bulk_url = f"{base_url}/api/atlas/v2/entity/bulk"
+    click.echo(f"Deleting {len(guids)} glossar{'y' if len(guids) == 1 else 'ies'} in bulk requests...")
+    deleted: Set[str] = set()
+    for start in range(0, len(guids), _BULK_DELETE_BATCH):
+        batch = guids[start:start + _BULK_DELETE_BATCH]
+        try:
+            logger.info(f"DELETE {bulk_url} ({len(batch)} GUIDs)")
+            
+            response = session.delete(bulk_url, params=[("guid", guid) for guid in batch])
+            if response.status_code not in [200, 204]:
+                logger.warning(f"Bulk delete failed (HTTP {response.status_code}), deleting one by one")
+                continue
+            
+            mutated = response.json().get("mutatedEntities", {}) if response.content else {}
+            deleted.update(entity.get("guid") for entity in mutated.get("DELETE", []))
+        except Exception as e:
+            logger.warning(f"Bulk delete failed ({str(e)}), deleting one by one")
+    return deleted
+
+
+def _delete_glossary(session, base_url: str, gloss: dict) -> Tuple[str, str, Optional[str]]:
+    """Delete one glossary and return its name, a status message and the message color"""
+    gloss_name = gloss.get("name", "Unknown")
+    gloss_guid = gloss.get("guid", gloss.get("id"))
+    
+    if not gloss_guid:
+        return gloss_name, f"✗ Cannot delete '{gloss_name}': No GUID found", None
+    
+    try:
+        delete_url = f"{base_url}/api/atlas/v2/glossary/{gloss_guid}"
+        logger.info(f"DELETE {delete_url}")
+        
+        delete_response = session.delete(delete_url)
+        
+        if delete_response.status_code in [200, 204]:
+            return gloss_name, f"✓ Deleted '{gloss_name}'", "green"
+        elif delete_response.status_code == 404:
+            return gloss_name, f"✓ '{gloss_name}' not found (already deleted?)", None
+        else:
+            try:
+                error_data = delete_response.json()
+                error_msg = error_data.get("errorMessage", delete_response.text)
+            except:
+                error_msg = delete_response.text
+            return gloss_name, f"✗ Failed to delete '{gloss_name}': {error_msg}", "red"
+    except Exception as e:
+        return gloss_name, f"✗ Error deleting '{gloss_name}': {str(e)}", "red"
+
+
 @click.command()
 @click.option(
     "--config",
@@ -49,7 +110,12 @@ logging.basicConfig(
     is_flag=True,
     help="Skip confirmation prompt",
 )
-def cleanup_glossaries(config, atlas_url, atlas_username, atlas_password, glossary_name, force):
+@click.option(
+    "--parallel",
+    type=click.IntRange(min=1),
+    help="Number of glossaries deleted concurrently (defaults to atlas.max_workers)",
+)
+def cleanup_glossaries(config, atlas_url, atlas_username, atlas_password, glossary_name, force, parallel):
     """Delete business glossaries from Atlas"""
     try:
         # Load configuration
@@ -69,11 +135,13 @@ def cleanup_glossaries(config, atlas_url, atlas_username, atlas_password, glossa
         click.echo(f"Atlas URL: {cfg.atlas.base_url}")
         
         # Initialize session
-        session = requests.Session()
-        session.auth = HTTPBasicAuth(cfg.atlas.username, cfg.atlas.password)
-        session.verify = cfg.atlas.verify_ssl
-        session.timeout = cfg.atlas.timeout
-        session.headers.update({"Content-Type": "application/json"})
+        session = build_atlas_session(
+            cfg.atlas.username,
+            cfg.atlas.password,
+            cfg.atlas.verify_ssl,
+            cfg.atlas.timeout,
+            pool_maxsize=parallel or cfg.atlas.max_workers,
+        )
         
         # Test connection
         click.echo("\nTesting connection to Atlas...")
@@ -87,9 +155,11 @@ def cleanup_glossaries(config, atlas_url, atlas_username, atlas_password, glossa
         click.echo("\nFetching glossaries from Atlas...")
         glossaries_url = f"{cfg.atlas.base_url}/api/atlas/v2/search/basic"
         
-        # Search for all glossaries
+        # Search for all live glossaries, projecting only the attributes used below
         search_payload = {
             "typeName": "AtlasGlossary",
+            "excludeDeletedEntities": True,
+            "attributes": ["name"],
             "limit": 1000
         }
         
@@ -145,37 +215,29 @@ def cleanup_glossaries(config, atlas_url, atlas_username, atlas_password, glossa
                 click.echo("✗ Cancelled")
                 return
         
-        # Delete glossaries
+        # Delete all glossaries with one bulk request first
         click.echo()
+        deleted_guids = _bulk_delete_glossaries(session, cfg.atlas.base_url, glossaries)
+        remaining = []
         for gloss in glossaries:
-            gloss_name = gloss.get("name", "Unknown")
-            gloss_guid = gloss.get("guid", gloss.get("id"))
-            
-            if not gloss_guid:
-                click.echo(f"✗ Cannot delete '{gloss_name}': No GUID found")
-                continue
-            
-            try:
-                delete_url = f"{cfg.atlas.base_url}/api/atlas/v2/glossary/{gloss_guid}"
-                
-                click.echo(f"Deleting '{gloss_name}'...")
-                logger.info(f"DELETE {delete_url}")
-                
-                delete_response = session.delete(delete_url)
-                
-                if delete_response.status_code in [200, 204]:
-                    click.echo(click.style(f"✓ Deleted '{gloss_name}'", fg='green'))
-                elif delete_response.status_code == 404:
-                    click.echo(f"✓ '{gloss_name}' not found (already deleted?)")
-                else:
-                    try:
-                        error_data = delete_response.json()
-                        error_msg = error_data.get("errorMessage", delete_response.text)
-                    except:
-                        error_msg = delete_response.text
-                    click.echo(click.style(f"✗ Failed to delete '{gloss_name}': {error_msg}", fg='red'))
-            except Exception as e:
-                click.echo(click.style(f"✗ Error deleting '{gloss_name}': {str(e)}", fg='red'))
+            if gloss.get("guid", gloss.get("id")) in deleted_guids:
+                gloss_name = gloss.get("name", "Unknown")
+                click.echo(click.style(f"✓ Deleted '{gloss_name}'", fg='green'))
+            else:
+                remaining.append(gloss)
+        
+        # Fall back to concurrent per-glossary deletes for anything the bulk
+        # request did not report as deleted, reporting in listing order
+        if remaining:
+            workers = parallel or cfg.atlas.max_workers
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    lambda gloss: _delete_glossary(session, cfg.atlas.base_url, gloss),
+                    remaining,
+                )
+                for gloss_name, message, color in results:
+                    click.echo(f"Deleting '{gloss_name}'...")
+                    click.echo(click.style(message, fg=color) if color else message)
         
         click.echo()
         click.echo("=" * 80)
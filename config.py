@@ -1,13 +1,25 @@
 """Configuration management for Atlas importer"""
 
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+# Prefer the LibYAML C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(config_path: str, mtime: float) -> dict:
+    """Parse a YAML file; the modification time keys the cache so edits are picked up"""
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+@dataclass(slots=True)
 class AtlasConfig:
     """Atlas REST API configuration"""
     base_url: str
@@ -15,25 +27,32 @@ class AtlasConfig:
     password: str
     verify_ssl: bool
     timeout: int
+    max_workers: int = 16
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportConfig:
     """CSV import configuration"""
     csv_file: str
     dry_run: bool
     log_level: str
     log_file: str
+    batch_size: int = 200
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipsConfig:
     """Relationship type configuration"""
     bidirectional_types: list
     unidirectional_types: list
+    bidirectional_set: frozenset = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Set for constant-time membership checks while parsing relationships
+        self.bidirectional_set = frozenset(self.bidirectional_types)
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Complete application configuration"""
     atlas: AtlasConfig
@@ -46,8 +65,8 @@ class Config:
         if not Path(config_path).exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
         
-        with open(config_path, "r") as f:
-            data = yaml.safe_load(f)
+        # Copy the cached document so callers can't mutate shared state
+        data = copy.deepcopy(_load_yaml(config_path, os.path.getmtime(config_path)))
         
         return cls(
             atlas=AtlasConfig(**data["atlas"]),
@@ -65,12 +84,14 @@ class Config:
                 password=os.getenv("ATLAS_PASSWORD", "admin"),
                 verify_ssl=os.getenv("ATLAS_VERIFY_SSL", "true").lower() == "true",
                 timeout=int(os.getenv("ATLAS_TIMEOUT", "30")),
+                max_workers=int(os.getenv("ATLAS_MAX_WORKERS", "16")),
             ),
             import_config=ImportConfig(
                 csv_file=os.getenv("CSV_FILE", "example_glossary.csv"),
                 dry_run=os.getenv("DRY_RUN", "true").lower() == "true",
                 log_level=os.getenv("LOG_LEVEL", "INFO"),
                 log_file=os.getenv("LOG_FILE", "atlas_import.log"),
+                batch_size=int(os.getenv("BATCH_SIZE", "200")),
             ),
             relationships=RelationshipsConfig(
                 bidirectional_types=[
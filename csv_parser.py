@@ -2,12 +2,17 @@
 
 import csv
 import logging
+from operator import itemgetter
+from sys import intern
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from models import Glossary, Category, Term, Relationship, RelationshipType
 
 logger = logging.getLogger(__name__)
 
+_REL_TYPE_MAP = {t.value: t for t in RelationshipType}
+_REL_TYPE_ERR = ", ".join(_REL_TYPE_MAP)
+
 
 class CSVParser:
     """Parse CSV file into entities and relationships"""
@@ -40,32 +45,75 @@ class CSVParser:
         self.categories: Dict[Tuple[str, str], Category] = {}  # (glossary, name)
         self.terms: Dict[Tuple[str, str], Term] = {}  # (glossary, name)
         self.relationships: List[Relationship] = []
+        self._glossary_filter: Optional[Set[str]] = None
+        self._term_filter: Optional[Set[str]] = None
+        self._row_handlers = {
+            "relationship": self._parse_relationship_row,
+            "glossary": self._parse_glossary_row,
+            "category": self._parse_category_row,
+            "term": self._parse_term_row,
+        }
     
-    def parse(self, csv_path: str) -> Tuple[Dict, Dict, Dict, List[Relationship]]:
-        """Parse CSV file and return entities and relationships"""
+    def parse(
+        self,
+        csv_path: str,
+        filter_glossary: Optional[Set[str]] = None,
+        filter_term: Optional[Set[str]] = None,
+    ) -> Tuple[Dict, Dict, Dict, List[Relationship]]:
+        """Parse CSV file and return entities and relationships, keeping only those matching the filters"""
         if not Path(csv_path).exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
         
+        # Rows are still validated when filtered out, they are just not kept
+        self._glossary_filter = filter_glossary or None
+        self._term_filter = filter_term or None
+        
         logger.info(f"Parsing CSV file: {csv_path}")
         
-        with open(csv_path, "r") as f:
-            reader = csv.DictReader(f)
+        # The stdlib reader streams rows in file order, which the first-definition-wins
+        # handlers and line-numbered errors rely on; columns are projected per
+        # entity type by the itemgetters bound in _bind_columns
+        with open(csv_path, "r", buffering=1024 * 1024, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
             
             # Validate headers
-            if not reader.fieldnames:
+            if not header:
                 raise ValueError("CSV file is empty")
             
-            missing_cols = self.REQUIRED_COLUMNS - set(reader.fieldnames)
+            missing_cols = self.REQUIRED_COLUMNS - set(header)
             if missing_cols:
                 raise ValueError(
                     f"CSV missing required columns: {', '.join(missing_cols)}"
                 )
             
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+            self._bind_columns(header)
+            width = len(header)
+            type_col = self._type_col
+            handlers = self._row_handlers
+            
+            for row in reader:
+                if not row:
+                    continue
+                
+                # Normalize to the header width plus one trailing empty cell
+                # that absent columns are bound to
+                if len(row) != width:
+                    del row[width:]
+                    row.extend([""] * (width - len(row)))
+                row.append("")
+                
+                # Dispatch on the entity type; the handlers strip only the columns they use
+                entity_type = row[type_col].strip().lower()
+                handler = handlers.get(entity_type)
+                if handler is None:
+                    logger.warning(f"Unknown entity type: {entity_type}")
+                    continue
+                
                 try:
-                    self._parse_row(row)
+                    handler(row)
                 except Exception as e:
-                    logger.error(f"Error parsing row {row_num}: {str(e)}")
+                    logger.error(f"Error parsing row {reader.line_num}: {str(e)}")
                     raise
         
         logger.info(
@@ -77,47 +125,62 @@ class CSVParser:
         
         return self.glossaries, self.categories, self.terms, self.relationships
     
-    def _parse_row(self, row: Dict[str, str]) -> None:
-        """Parse a single CSV row"""
-        # Clean up row values
-        row = {k: (v.strip() if v else "") for k, v in row.items()}
-        
-        entity_type = row.get("type", "").lower()
-        
-        if entity_type == "relationship":
-            self._parse_relationship_row(row)
-        elif entity_type == "glossary":
-            self._parse_glossary_row(row)
-        elif entity_type == "category":
-            self._parse_category_row(row)
-        elif entity_type == "term":
-            self._parse_term_row(row)
-        else:
-            logger.warning(f"Unknown entity type: {entity_type}")
+    def _bind_columns(self, header: List[str]) -> None:
+        """Resolve the column positions each row handler reads from the header"""
+        index = {name: i for i, name in enumerate(header)}
+        missing = len(header)  # position of the empty cell appended to every row
+        
+        def fields(*names: str) -> itemgetter:
+            return itemgetter(*(index.get(name, missing) for name in names))
+        
+        self._type_col = index["type"]
+        self._glossary_col = index["glossary_name"]
+        self._category_fields = fields(
+            "glossary_name", "name", "parent_category_name",
+            "short_description", "long_description", "status",
+        )
+        self._term_fields = fields(
+            "glossary_name", "name", "category_names", "short_description",
+            "long_description", "status", "steward", "abbreviation", "examples",
+        )
+        self._relationship_fields = fields(
+            "glossary_name", "name", "linked_glossary_name",
+            "linked_entity_name", "relationship_type",
+        )
     
-    def _parse_glossary_row(self, row: Dict[str, str]) -> None:
+    def _parse_glossary_row(self, row: List[str]) -> None:
         """Parse a glossary row"""
-        name = row.get("glossary_name", "").strip()
+        name = intern(row[self._glossary_col].strip())
         
         if not name:
             raise ValueError("Glossary must have a glossary_name")
         
+        if self._glossary_filter and name not in self._glossary_filter:
+            return
+        
         if name not in self.glossaries:
             self.glossaries[name] = Glossary(name=name)
-            logger.debug(f"Created glossary: {name}")
+            logger.debug("Created glossary: %s", name)
     
-    def _parse_category_row(self, row: Dict[str, str]) -> None:
+    def _parse_category_row(self, row: List[str]) -> None:
         """Parse a category row"""
-        glossary_name = row.get("glossary_name", "").strip()
-        name = row.get("name", "").strip()
-        parent = row.get("parent_category_name", "").strip() or None
-        short_desc = row.get("short_description", "").strip() or None
-        long_desc = row.get("long_description", "").strip() or None
-        status = row.get("status", "Active").strip() or "Active"
+        glossary_name, name, parent, short_desc, long_desc, status = [
+            value.strip() for value in self._category_fields(row)
+        ]
+        # Interned here as well because they also form the dictionary keys
+        glossary_name = intern(glossary_name)
+        name = intern(name)
+        parent = parent or None
+        short_desc = short_desc or None
+        long_desc = long_desc or None
+        status = status or "Active"
         
         if not glossary_name or not name:
             raise ValueError("Category must have glossary_name and name")
         
+        if self._glossary_filter and glossary_name not in self._glossary_filter:
+            return
+        
         # Ensure glossary exists
         if glossary_name not in self.glossaries:
             self.glossaries[glossary_name] = Glossary(name=glossary_name)
@@ -133,28 +196,38 @@ class CSVParser:
                 status=status,
             )
             self.categories[key] = category
-            logger.debug(f"Created category: {glossary_name}.{name}")
+            logger.debug("Created category: %s.%s", glossary_name, name)
     
-    def _parse_term_row(self, row: Dict[str, str]) -> None:
+    def _parse_term_row(self, row: List[str]) -> None:
         """Parse a term row"""
-        glossary_name = row.get("glossary_name", "").strip()
-        name = row.get("name", "").strip()
-        category_names_str = row.get("category_names", "").strip()
-        category_names = [c.strip() for c in category_names_str.split(",") if c.strip()]
-        short_desc = row.get("short_description", "").strip() or None
-        long_desc = row.get("long_description", "").strip() or None
-        status = row.get("status", "Active").strip() or "Active"
-        steward = row.get("steward", "").strip() or None
-        abbreviation = row.get("abbreviation", "").strip() or None
-        examples = row.get("examples", "").strip() or None
+        (
+            glossary_name, name, category_names_str, short_desc, long_desc,
+            status, steward, abbreviation, examples,
+        ) = [value.strip() for value in self._term_fields(row)]
+        # Interned here as well because they also form the dictionary keys
+        glossary_name = intern(glossary_name)
+        name = intern(name)
+        category_names = [cat for c in category_names_str.split(",") if (cat := c.strip())]
+        short_desc = short_desc or None
+        long_desc = long_desc or None
+        status = status or "Active"
+        steward = steward or None
+        abbreviation = abbreviation or None
+        examples = examples or None
         
         if not glossary_name or not name:
             raise ValueError("Term must have glossary_name and name")
         
+        if self._glossary_filter and glossary_name not in self._glossary_filter:
+            return
+        
         # Ensure glossary exists
         if glossary_name not in self.glossaries:
             self.glossaries[glossary_name] = Glossary(name=glossary_name)
         
+        if self._term_filter and name not in self._term_filter:
+            return
+        
         key = (glossary_name, name)
         if key not in self.terms:
             term = Term(
@@ -169,15 +242,18 @@ class CSVParser:
                 examples=examples,
             )
             self.terms[key] = term
-            logger.debug(f"Created term: {glossary_name}.{name}")
+            logger.debug("Created term: %s.%s", glossary_name, name)
     
-    def _parse_relationship_row(self, row: Dict[str, str]) -> None:
+    def _parse_relationship_row(self, row: List[str]) -> None:
         """Parse a relationship row"""
-        source_glossary = row.get("glossary_name", "").strip()
-        source_name = row.get("name", "").strip()
-        target_glossary = row.get("linked_glossary_name", "").strip()
-        target_name = row.get("linked_entity_name", "").strip()
-        rel_type_str = row.get("relationship_type", "").strip().lower()
+        source_glossary, source_name, target_glossary, target_name, rel_type_str = [
+            value.strip() for value in self._relationship_fields(row)
+        ]
+        source_glossary = intern(source_glossary)
+        source_name = intern(source_name)
+        target_glossary = intern(target_glossary)
+        target_name = intern(target_name)
+        rel_type_str = rel_type_str.lower()
         
         if not all([source_glossary, source_name, target_glossary, target_name, rel_type_str]):
             raise ValueError(
@@ -186,30 +262,29 @@ class CSVParser:
             )
         
         # Validate relationship type
-        try:
-            rel_type = RelationshipType(rel_type_str)
-        except ValueError:
+        rel_type = _REL_TYPE_MAP.get(rel_type_str)
+        if rel_type is None:
             raise ValueError(
                 f"Unknown relationship type: {rel_type_str}. "
-                f"Valid types: {', '.join([t.value for t in RelationshipType])}"
+                f"Valid types: {_REL_TYPE_ERR}"
             )
         
         # Determine if bidirectional
-        is_bidirectional = rel_type_str in self.config.relationships.bidirectional_types
-        
-        relationship = Relationship(
-            source_glossary=source_glossary,
-            source_name=source_name,
-            target_glossary=target_glossary,
-            target_name=target_name,
-            relationship_type=rel_type,
-            is_bidirectional=is_bidirectional,
-        )
+        is_bidirectional = rel_type_str in self.config.relationships.bidirectional_set
         
-        self.relationships.append(relationship)
+        if self._keep_relationship(source_glossary, source_name, target_name):
+            relationship = Relationship(
+                source_glossary=source_glossary,
+                source_name=source_name,
+                target_glossary=target_glossary,
+                target_name=target_name,
+                relationship_type=rel_type,
+                is_bidirectional=is_bidirectional,
+            )
+            self.relationships.append(relationship)
         
         # Add reverse relationship if bidirectional
-        if is_bidirectional:
+        if is_bidirectional and self._keep_relationship(target_glossary, target_name, source_name):
             reverse_relationship = Relationship(
                 source_glossary=target_glossary,
                 source_name=target_name,
@@ -221,7 +296,14 @@ class CSVParser:
             self.relationships.append(reverse_relationship)
         
         logger.debug(
-            f"Created relationship: {source_glossary}.{source_name} "
-            f"{rel_type_str} {target_glossary}.{target_name} "
-            f"(bidirectional: {is_bidirectional})"
+            "Created relationship: %s.%s %s %s.%s (bidirectional: %s)",
+            source_glossary, source_name, rel_type_str, target_glossary, target_name, is_bidirectional,
         )
+    
+    def _keep_relationship(self, source_glossary: str, source_name: str, target_name: str) -> bool:
+        """Return whether a relationship passes the glossary and term filters"""
+        if self._glossary_filter and source_glossary not in self._glossary_filter:
+            return False
+        if self._term_filter:
+            return source_name in self._term_filter or target_name in self._term_filter
+        return True
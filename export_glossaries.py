@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """Export glossaries from Cloudera Atlas"""
 
+import json
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 import click
-import requests
-from requests.auth import HTTPBasicAuth
+from atlas_cache import CachingSession
+from atlas_client import build_atlas_session
 from config import Config
 
 logging.basicConfig(
@@ -15,6 +18,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _fetch_collection(session, url: str) -> List[dict]:
+    """Fetch a glossary's categories or terms, returning an empty list on failure"""
+    try:
+        response = session.get(url)
+        if response.status_code == 200:
+            return response.json()
+    except Exception as e:
+        logger.debug(f"Failed to get {url}: {str(e)}")
+    return []
+
+
+def _display_name(header: dict) -> str:
+    """Return the name shown for a category or term listing entry"""
+    return header.get("displayText") or header.get("displayName", header.get("name", "Unknown"))
+
+
 @click.command()
 @click.option(
     "--config",
@@ -22,7 +41,20 @@ logger = logging.getLogger(__name__)
     default="config.yaml",
     help="Path to configuration file",
 )
-def export_glossaries(config):
+@click.option(
+    "--cache-ttl",
+    type=click.FloatRange(min=0),
+    default=0,
+    show_default=True,
+    help="Reuse Atlas responses cached on disk for this many seconds (0 disables the cache)",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print the glossaries as JSON instead of the readable listing",
+)
+def export_glossaries(config, cache_ttl, as_json):
     """Export all glossaries from Atlas"""
     try:
         cfg = Config.from_file(config)
@@ -35,27 +67,29 @@ def export_glossaries(config):
         # Search for all glossaries
         url = f"{cfg.atlas.base_url}/api/atlas/v2/search/basic"
         
+        # Soft-deleted glossaries are not exported, so don't transfer them
         params = {
             "typeName": "AtlasGlossary",
+            "excludeDeletedEntities": "true",
             "limit": 1000,
         }
         
-        headers = {
-            "Content-Type": "application/json",
-        }
-        
-        auth = HTTPBasicAuth(cfg.atlas.username, cfg.atlas.password)
+        # One session for every call so the keep-alive connection is reused
+        session = build_atlas_session(
+            cfg.atlas.username,
+            cfg.atlas.password,
+            cfg.atlas.verify_ssl,
+            cfg.atlas.timeout,
+            pool_maxsize=cfg.atlas.max_workers,
+        )
+        if cache_ttl:
+            session = CachingSession(session, cache_ttl)
         
+        # The search runs before the concurrent fetches below, so it also
+        # warms the pool with the first keep-alive connection
         logger.info(f"Searching for glossaries at {url}")
         
-        response = requests.get(
-            url,
-            params=params,
-            headers=headers,
-            auth=auth,
-            verify=cfg.atlas.verify_ssl,
-            timeout=cfg.atlas.timeout,
-        )
+        response = session.get(url, params=params)
         
         if response.status_code != 200:
             logger.error(f"Failed to search glossaries: {response.status_code}")
@@ -66,66 +100,61 @@ def export_glossaries(config):
         entities = data.get("entities", [])
         
         if not entities:
-            click.echo("\n📚 No glossaries found in Atlas")
+            click.echo("[]" if as_json else "\n📚 No glossaries found in Atlas")
             return
         
-        click.echo(f"\n📚 GLOSSARIES ({len(entities)}):")
-        click.echo("=" * 80)
-        
+        # Fetch every glossary's categories and terms concurrently, then print
+        # the results in search order. Only names are printed, so the compact
+        # header listings are requested instead of the full entities.
+        glossary_url = f"{cfg.atlas.base_url}/api/atlas/v2/glossary"
+        urls = []
         for entity in entities:
             guid = entity.get("guid", "N/A")
+            urls.append(f"{glossary_url}/{guid}/categories/headers")
+            urls.append(f"{glossary_url}/{guid}/terms/headers")
+        with ThreadPoolExecutor(max_workers=cfg.atlas.max_workers) as executor:
+            results = list(executor.map(lambda url: _fetch_collection(session, url), urls))
+        contents = zip(results[0::2], results[1::2])
+        
+        exported = []
+        for entity, (categories, terms) in zip(entities, contents):
             attributes = entity.get("attributes", {})
             name = attributes.get("name", "Unknown")
-            display_name = attributes.get("displayName", name)
-            short_desc = attributes.get("shortDescription", "")
+            exported.append({
+                "guid": entity.get("guid", "N/A"),
+                "name": name,
+                "displayName": attributes.get("displayName", name),
+                "shortDescription": attributes.get("shortDescription", ""),
+                "categories": [_display_name(cat) for cat in categories],
+                "terms": [_display_name(term) for term in terms],
+            })
+        
+        if as_json:
+            click.echo(json.dumps(exported, indent=2))
+            return
+        
+        click.echo(f"\n📚 GLOSSARIES ({len(exported)}):")
+        click.echo("=" * 80)
+        
+        # Emit each glossary's block with a single write
+        for glossary in exported:
+            lines = [
+                f"\nGUID: {glossary['guid']}",
+                f"Name: {glossary['name']}",
+                f"Display Name: {glossary['displayName']}",
+            ]
+            if glossary["shortDescription"]:
+                lines.append(f"Description: {glossary['shortDescription']}")
             
-            click.echo(f"\nGUID: {guid}")
-            click.echo(f"Name: {name}")
-            click.echo(f"Display Name: {display_name}")
-            if short_desc:
-                click.echo(f"Description: {short_desc}")
+            if glossary["categories"]:
+                lines.append(f"  Categories ({len(glossary['categories'])}):")
+                lines.extend(f"    - {cat_name}" for cat_name in glossary["categories"])
             
-            # Get categories for this glossary
-            category_url = f"{cfg.atlas.base_url}/api/atlas/v2/glossary/{guid}/categories"
-            try:
-                cat_response = requests.get(
-                    category_url,
-                    headers=headers,
-                    auth=auth,
-                    verify=cfg.atlas.verify_ssl,
-                    timeout=cfg.atlas.timeout,
-                )
-                
-                if cat_response.status_code == 200:
-                    categories = cat_response.json()
-                    if categories:
-                        click.echo(f"  Categories ({len(categories)}):")
-                        for cat in categories:
-                            cat_name = cat.get("displayName", cat.get("name", "Unknown"))
-                            click.echo(f"    - {cat_name}")
-            except Exception as e:
-                logger.debug(f"Failed to get categories: {str(e)}")
+            if glossary["terms"]:
+                lines.append(f"  Terms ({len(glossary['terms'])}):")
+                lines.extend(f"    - {term_name}" for term_name in glossary["terms"])
             
-            # Get terms for this glossary
-            terms_url = f"{cfg.atlas.base_url}/api/atlas/v2/glossary/{guid}/terms"
-            try:
-                terms_response = requests.get(
-                    terms_url,
-                    headers=headers,
-                    auth=auth,
-                    verify=cfg.atlas.verify_ssl,
-                    timeout=cfg.atlas.timeout,
-                )
-                
-                if terms_response.status_code == 200:
-                    terms = terms_response.json()
-                    if terms:
-                        click.echo(f"  Terms ({len(terms)}):")
-                        for term in terms:
-                            term_name = term.get("displayName", term.get("name", "Unknown"))
-                            click.echo(f"    - {term_name}")
-            except Exception as e:
-                logger.debug(f"Failed to get terms: {str(e)}")
+            click.echo("\n".join(lines))
         
         click.echo("\n" + "=" * 80)
         
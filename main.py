@@ -6,13 +6,17 @@ Imports business glossaries, categories, and terms from CSV files into Cloudera
 Supports relationship definition as separate rows with bidirectional linking and dry-run validation.
 """
 
+import gc
+import io
+import json
 import logging
 import sys
 import click
 from pathlib import Path
 from config import Config
 from csv_parser import CSVParser
-from relationship_graph import RelationshipGraphBuilder
+from models import SummaryStats, RELATIONSHIP_FIELD_PAIRS, relationship_lists
+from relationship_graph import RelationshipGraphBuilder, order_categories
 from atlas_client import AtlasClient
 
 
@@ -23,6 +27,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Reused by the dry-run listing; json.dumps builds a new encoder whenever indent is passed
+_JSON_INDENT_2 = json.JSONEncoder(indent=2)
+_JSON_INDENT_4 = json.JSONEncoder(indent=4)
+
+# Heading of each relationship list in the dry-run report, e.g. "Related Terms"
+_REL_LABELS = tuple((attr.replace("_", " ").title(), attr) for _, attr in RELATIONSHIP_FIELD_PAIRS)
+
 
 @click.group()
 def cli():
@@ -70,6 +81,11 @@ def cli():
     type=int,
     help="Request timeout in seconds (overrides config)",
 )
+@click.option(
+    "--max-workers",
+    type=int,
+    help="Maximum number of concurrent Atlas requests (overrides config)",
+)
 @click.option(
     "--log-level",
     type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"]),
@@ -100,6 +116,11 @@ def cli():
     is_flag=True,
     help="Validate CSV without creating anything",
 )
+@click.option(
+    "--quiet",
+    is_flag=True,
+    help="Print only summary counts instead of the full dry-run report and REST call listing",
+)
 def import_glossary(
     config,
     csv,
@@ -109,12 +130,14 @@ def import_glossary(
     atlas_password,
     verify_ssl,
     timeout,
+    max_workers,
     log_level,
     log_file,
     filter_glossary,
     filter_term,
     exclude_relationships,
     validate_only,
+    quiet,
 ):
     """Import business glossary from CSV file to Atlas"""
     try:
@@ -142,6 +165,8 @@ def import_glossary(
             cfg.atlas.verify_ssl = verify_ssl
         if timeout is not None:
             cfg.atlas.timeout = timeout
+        if max_workers is not None:
+            cfg.atlas.max_workers = max_workers
         
         # Set up logging
         log_level_obj = getattr(logging, cfg.import_config.log_level)
@@ -169,60 +194,76 @@ def import_glossary(
         logger.info(f"Atlas URL: {cfg.atlas.base_url}")
         logger.info(f"SSL verification: {cfg.atlas.verify_ssl}")
         logger.info(f"Request timeout: {cfg.atlas.timeout}s")
+        logger.info(f"Max concurrent requests: {cfg.atlas.max_workers}")
         logger.info("=" * 80)
         
-        # Parse CSV
-        parser = CSVParser(cfg)
-        glossaries, categories, terms, relationships = parser.parse(
-            cfg.import_config.csv_file
-        )
-        
-        # Apply filters
-        if filter_glossary:
-            filter_glossary_set = set(filter_glossary)
-            glossaries = {k: v for k, v in glossaries.items() if k in filter_glossary_set}
-            categories = {k: v for k, v in categories.items() if k[0] in filter_glossary_set}
-            terms = {k: v for k, v in terms.items() if k[0] in filter_glossary_set}
-            relationships = [r for r in relationships if r.source_glossary in filter_glossary_set]
-            logger.info(f"Applied glossary filter: {', '.join(filter_glossary)}")
-        
-        if filter_term:
-            filter_term_set = set(filter_term)
-            terms = {k: v for k, v in terms.items() if k[1] in filter_term_set}
-            relationships = [
-                r for r in relationships
-                if r.source_name in filter_term_set or r.target_name in filter_term_set
-            ]
-            logger.info(f"Applied term filter: {', '.join(filter_term)}")
-        
-        # Build relationship graph
-        graph_builder = RelationshipGraphBuilder(terms)
-        
-        if not exclude_relationships:
-            graph_builder.apply_relationships(relationships)
-        else:
-            logger.info("Relationship creation disabled by --exclude-relationships flag")
-            relationships = []
+        # Parsing builds many small containers but no reference cycles, so the
+        # cyclic collector is paused until the model is complete and then frozen
+        # out of later collections that the import would otherwise trigger
+        gc.disable()
+        try:
+            # Parse CSV
+            parser = CSVParser(cfg)
+            # Filters are applied while parsing so unwanted rows are never kept
+            glossaries, categories, terms, relationships = parser.parse(
+                cfg.import_config.csv_file,
+                filter_glossary=set(filter_glossary),
+                filter_term=set(filter_term),
+            )
+            if filter_glossary:
+                logger.info(f"Applied glossary filter: {', '.join(filter_glossary)}")
+            if filter_term:
+                logger.info(f"Applied term filter: {', '.join(filter_term)}")
+            
+            # Resolve the parent-first category order up front so a missing parent
+            # or a cycle fails the run before any Atlas call is made
+            category_order = order_categories(categories)
+            
+            # Build relationship graph
+            graph_builder = RelationshipGraphBuilder(terms)
+            
+            if not exclude_relationships:
+                graph_builder.apply_relationships(relationships)
+            else:
+                logger.info("Relationship creation disabled by --exclude-relationships flag")
+                relationships = []
+            
+            # Validate relationships
+            warnings = sorted(graph_builder.validate_all_relationships())
+        finally:
+            gc.enable()
+        gc.freeze()
         
-        # Validate relationships
-        warnings = graph_builder.validate_all_relationships()
         if warnings:
             logger.warning(f"Found {len(warnings)} relationship validation warnings:")
-            for warning in sorted(warnings):
-                logger.warning(f"  - {warning}")
+            for warning in warnings:
+                logger.warning("  - %s", warning)
         
-        # Display dry-run report
-        _print_dry_run_report(
-            glossaries,
-            categories,
-            terms,
-            warnings,
-            exclude_relationships,
-        )
+        # Count entities and relationships once for every report below
+        stats = SummaryStats.from_collections(glossaries, categories, terms)
+        
+        # Display dry-run report; quiet runs skip the per-entity listings
+        # (and the sorting they need) and only print the summary counts
+        if quiet:
+            click.echo(_format_summary(stats, warnings, exclude_relationships), nl=False)
+        else:
+            sorted_glossaries = sorted(glossaries)
+            sorted_terms = sorted(terms.items())
+            _print_dry_run_report(
+                sorted_glossaries,
+                sorted(categories.items()),
+                sorted_terms,
+                warnings,
+                exclude_relationships,
+                stats,
+            )
         
         if validate_only:
             click.echo("\n✓ Validation completed successfully")
             logger.info("Validation completed successfully (--validate-only)")
+        elif cfg.import_config.dry_run and quiet:
+            click.echo("\n✓ Dry-run validation completed successfully")
+            logger.info("Dry-run completed successfully")
         elif cfg.import_config.dry_run:
             click.echo("\n" + "=" * 80)
             click.echo("DRY-RUN MODE: Showing REST API calls that would be executed")
@@ -230,10 +271,12 @@ def import_glossary(
             
             _print_rest_api_calls(
                 cfg,
-                glossaries,
+                sorted_glossaries,
                 categories,
-                terms,
-                exclude_relationships
+                category_order,
+                sorted_terms,
+                exclude_relationships,
+                stats,
             )
             
             click.echo("\n✓ Dry-run validation completed successfully")
@@ -249,7 +292,9 @@ def import_glossary(
                 glossaries,
                 categories,
                 terms,
-                exclude_relationships
+                graph_builder.target_keys,
+                exclude_relationships,
+                stats,
             )
             
             click.echo(click.style("\n✓ Glossary import completed successfully!", fg='green', bold=True))
@@ -265,92 +310,86 @@ def import_glossary(
         sys.exit(1)
 
 
-def _execute_import(cfg, glossaries, categories, terms, exclude_relationships):
+def _execute_import(cfg, glossaries, categories, terms, target_keys, exclude_relationships, stats):
     """Execute actual import to Atlas (Passes 2-5)"""
     
-    # Initialize client
-    client = AtlasClient(
+    # Initialize client; one session serves every pass and is closed at the end
+    with AtlasClient(
         cfg.atlas.base_url,
         cfg.atlas.username,
         cfg.atlas.password,
         cfg.atlas.verify_ssl,
-        cfg.atlas.timeout
-    )
-    
-    # Test connection
-    click.echo("\nTesting connection to Atlas...")
-    if not client.test_connection():
-        raise Exception("Failed to connect to Atlas server")
-    
-    # Pass 2: Create glossaries
-    click.echo("\nPass 2: Creating glossaries...")
-    glossary_guid_map = client.create_glossaries(glossaries)
-    click.echo(click.style(f"✓ Created {len(glossary_guid_map)} glossary/glossaries", fg='green'))
-    
-    # Pass 3: Create categories (handles dependency ordering)
-    click.echo("\nPass 3: Creating categories...")
-    category_guid_map = client.create_categories(categories, glossary_guid_map)
-    click.echo(click.style(f"✓ Created {len(category_guid_map)} categor{'ies' if len(category_guid_map) != 1 else 'y'}", fg='green'))
-    
-    # Pass 4: Create terms
-    click.echo("\nPass 4: Creating terms...")
-    term_guid_map = client.create_terms(terms, glossary_guid_map, category_guid_map)
-    click.echo(click.style(f"✓ Created {len(term_guid_map)} term{'s' if len(term_guid_map) != 1 else ''}", fg='green'))
-    
-    # Pass 5: Create relationships
-    if not exclude_relationships:
-        click.echo("\nPass 5: Creating term relationships...")
-        client.update_term_relationships(term_guid_map, terms)
+        cfg.atlas.timeout,
+        cfg.atlas.max_workers,
+        cfg.import_config.batch_size,
+    ) as client:
+        # Test connection
+        click.echo("\nTesting connection to Atlas...")
+        if not client.test_connection():
+            raise Exception("Failed to connect to Atlas server")
         
-        # Count relationships
-        rel_count = sum(
-            len(term.synonyms) + len(term.antonyms) + len(term.related_terms) +
-            len(term.preferred_terms) + len(term.replacement_terms) + len(term.see_also) +
-            len(term.is_a) + len(term.classifies)
-            for term in terms.values()
-        )
-        click.echo(click.style(f"✓ Created {rel_count} relationship{'s' if rel_count != 1 else ''}", fg='green'))
-    else:
-        click.echo("\nPass 5: Skipped relationship creation (--exclude-relationships)")
+        # Pass 2: Create glossaries
+        click.echo("\nPass 2: Creating glossaries...")
+        glossary_guid_map = client.create_glossaries(glossaries)
+        click.echo(click.style(f"✓ Created {len(glossary_guid_map)} glossary/glossaries", fg='green'))
+        
+        # Pass 3: Create categories (handles dependency ordering)
+        click.echo("\nPass 3: Creating categories...")
+        category_guid_map = client.create_categories(categories, glossary_guid_map)
+        click.echo(click.style(f"✓ Created {len(category_guid_map)} categor{'ies' if len(category_guid_map) != 1 else 'y'}", fg='green'))
+        
+        # Pass 4: Create terms
+        click.echo("\nPass 4: Creating terms...")
+        term_guid_map = client.create_terms(terms, glossary_guid_map, category_guid_map)
+        click.echo(click.style(f"✓ Created {len(term_guid_map)} term{'s' if len(term_guid_map) != 1 else ''}", fg='green'))
+        
+        # Pass 5: Create relationships
+        if not exclude_relationships:
+            click.echo("\nPass 5: Creating term relationships...")
+            client.update_term_relationships(term_guid_map, terms, target_keys)
+            rel_count = stats.relationship_count
+            click.echo(click.style(f"✓ Created {rel_count} relationship{'s' if rel_count != 1 else ''}", fg='green'))
+        else:
+            click.echo("\nPass 5: Skipped relationship creation (--exclude-relationships)")
     
     click.echo("\n" + "=" * 80)
 
 
-def _print_rest_api_calls(cfg, glossaries, categories, terms, exclude_relationships):
-    """Print REST API calls that would be executed (debug mode for dry-run)"""
-    import json
+def _print_rest_api_calls(cfg, glossaries, categories, category_order, terms, exclude_relationships, stats):
+    """Print REST API calls that would be executed (debug mode for dry-run); glossaries and terms come pre-sorted"""
+    # Build the whole listing in memory and write it to stdout once
+    buf = io.StringIO()
     
-    click.echo("\n" + "=" * 80)
-    click.echo("PASS 2: CREATE GLOSSARIES")
-    click.echo("=" * 80)
+    print("\n" + "=" * 80, file=buf)
+    print("PASS 2: CREATE GLOSSARIES", file=buf)
+    print("=" * 80, file=buf)
     
-    for name in sorted(glossaries.keys()):
+    for name in glossaries:
         payload = {
             "name": name,
             "shortDescription": f"Glossary: {name}"
         }
-        click.echo(f"\nPOST {cfg.atlas.base_url}v2/glossary")
-        click.echo(json.dumps(payload, indent=2))
+        print(f"\nPOST {cfg.atlas.base_url}v2/glossary", file=buf)
+        print(_JSON_INDENT_2.encode(payload), file=buf)
     
-    click.echo("\n" + "=" * 80)
-    click.echo("PASS 3: CREATE CATEGORIES (parent-first order)")
-    click.echo("=" * 80)
+    print("\n" + "=" * 80, file=buf)
+    print("PASS 3: CREATE CATEGORIES (parent-first order)", file=buf)
+    print("=" * 80, file=buf)
     
-    # Group categories by glossary
+    # Group categories by glossary, keeping the parent-first order within each
     categories_by_glossary = {}
-    for (glossary, name), cat in sorted(categories.items()):
+    for glossary, name in category_order:
         if glossary not in categories_by_glossary:
             categories_by_glossary[glossary] = []
-        categories_by_glossary[glossary].append((name, cat))
+        categories_by_glossary[glossary].append((name, categories[(glossary, name)]))
     
     for glossary in sorted(categories_by_glossary.keys()):
-        click.echo(f"\nGlossary: {glossary}")
-        for name, cat in sorted(categories_by_glossary[glossary]):
+        print(f"\nGlossary: {glossary}", file=buf)
+        anchor = {"glossaryGuid": f"<glossary_guid:{glossary}>"}
+        for name, cat in categories_by_glossary[glossary]:
             payload = {
                 "name": name,
-                "anchor": {
-                    "glossaryGuid": f"<glossary_guid:{glossary}>"
-                },
+                "anchor": anchor,
                 "shortDescription": cat.short_description or f"Category: {name}"
             }
             if cat.parent_category_name:
@@ -358,30 +397,29 @@ def _print_rest_api_calls(cfg, glossaries, categories, terms, exclude_relationsh
                     "categoryGuid": f"<category_guid:{glossary}.{cat.parent_category_name}>"
                 }
             
-            click.echo(f"  POST {cfg.atlas.base_url}v2/glossary/categories")
-            click.echo("  " + json.dumps(payload, indent=4).replace("\n", "\n  "))
+            print(f"  POST {cfg.atlas.base_url}v2/glossary/categories", file=buf)
+            print("  " + _JSON_INDENT_4.encode(payload).replace("\n", "\n  "), file=buf)
     
-    click.echo("\n" + "=" * 80)
-    click.echo("PASS 4: CREATE TERMS")
-    click.echo("=" * 80)
+    print("\n" + "=" * 80, file=buf)
+    print("PASS 4: CREATE TERMS", file=buf)
+    print("=" * 80, file=buf)
     
-    # Group terms by glossary
+    # Group terms by glossary; groups and their members stay in sorted order
     terms_by_glossary = {}
-    for (glossary, name), term in sorted(terms.items()):
+    for (glossary, name), term in terms:
         if glossary not in terms_by_glossary:
             terms_by_glossary[glossary] = []
         terms_by_glossary[glossary].append((name, term))
     
-    for glossary in sorted(terms_by_glossary.keys()):
-        click.echo(f"\nGlossary: {glossary} (batch create)")
+    for glossary in terms_by_glossary:
+        print(f"\nGlossary: {glossary} (batch create)", file=buf)
         
         batch_payload = []
-        for name, term in sorted(terms_by_glossary[glossary]):
+        anchor = {"glossaryGuid": f"<glossary_guid:{glossary}>"}
+        for name, term in terms_by_glossary[glossary]:
             term_payload = {
                 "name": name,
-                "anchor": {
-                    "glossaryGuid": f"<glossary_guid:{glossary}>"
-                },
+                "anchor": anchor,
                 "shortDescription": term.short_description or f"Term: {name}"
             }
             
@@ -406,191 +444,135 @@ def _print_rest_api_calls(cfg, glossaries, categories, terms, exclude_relationsh
             
             batch_payload.append(term_payload)
         
-        click.echo(f"  POST {cfg.atlas.base_url}v2/glossary/terms")
-        click.echo("  " + json.dumps(batch_payload, indent=4).replace("\n", "\n  "))
+        print(f"  POST {cfg.atlas.base_url}v2/glossary/terms", file=buf)
+        print("  " + _JSON_INDENT_4.encode(batch_payload).replace("\n", "\n  "), file=buf)
     
     if not exclude_relationships:
-        click.echo("\n" + "=" * 80)
-        click.echo("PASS 5: CREATE TERM RELATIONSHIPS")
-        click.echo("=" * 80)
+        print("\n" + "=" * 80, file=buf)
+        print("PASS 5: CREATE TERM RELATIONSHIPS", file=buf)
+        print("=" * 80, file=buf)
         
-        for (glossary, name), term in sorted(terms.items()):
-            if any([
-                term.synonyms, term.antonyms, term.related_terms,
-                term.preferred_terms, term.replacement_terms, term.see_also,
-                term.is_a, term.classifies
-            ]):
-                click.echo(f"\nTerm: {glossary}.{name}")
+        for (glossary, name), term in terms:
+            if any(relationship_lists(term)):
+                print(f"\nTerm: {glossary}.{name}", file=buf)
                 
                 payload = {
                     "guid": f"<term_guid:{glossary}.{name}>"
                 }
                 
-                if term.synonyms:
-                    payload["synonyms"] = [
-                        {"termGuid": f"<term_guid:{target}>"}
-                        for target in term.synonyms
-                    ]
-                
-                if term.antonyms:
-                    payload["antonyms"] = [
-                        {"termGuid": f"<term_guid:{target}>"}
-                        for target in term.antonyms
-                    ]
+                for field, attr in RELATIONSHIP_FIELD_PAIRS:
+                    targets = getattr(term, attr)
+                    if targets:
+                        payload[field] = [
+                            {"termGuid": f"<term_guid:{target}>"}
+                            for target in targets
+                        ]
                 
-                if term.related_terms:
-                    payload["relatedTerms"] = [
-                        {"termGuid": f"<term_guid:{target}>"}
-                        for target in term.related_terms
-                    ]
-                
-                if term.preferred_terms:
-                    payload["preferredTerms"] = [
-                        {"termGuid": f"<term_guid:{target}>"}
-                        for target in term.preferred_terms
-                    ]
-                
-                if term.replacement_terms:
-                    payload["replacementTerms"] = [
-                        {"termGuid": f"<term_guid:{target}>"}
-                        for target in term.replacement_terms
-                    ]
-                
-                if term.see_also:
-                    payload["seeAlso"] = [
-                        {"termGuid": f"<term_guid:{target}>"}
-                        for target in term.see_also
-                    ]
-                
-                if term.is_a:
-                    payload["isA"] = [
-                        {"termGuid": f"<term_guid:{target}>"}
-                        for target in term.is_a
-                    ]
-                
-                if term.classifies:
-                    payload["classifies"] = [
-                        {"termGuid": f"<term_guid:{target}>"}
-                        for target in term.classifies
-                    ]
-                
-                click.echo(f"  PUT {cfg.atlas.base_url}v2/glossary/term/<term_guid>")
-                click.echo("  " + json.dumps(payload, indent=4).replace("\n", "\n  "))
+                print(f"  PUT {cfg.atlas.base_url}v2/glossary/term/<term_guid>", file=buf)
+                print("  " + _JSON_INDENT_4.encode(payload).replace("\n", "\n  "), file=buf)
     
-    click.echo("\n" + "=" * 80)
-    click.echo("END OF REST API CALLS (DEBUG OUTPUT)")
-    click.echo("=" * 80)
+    print("\n" + "=" * 80, file=buf)
+    print("END OF REST API CALLS (DEBUG OUTPUT)", file=buf)
+    print("=" * 80, file=buf)
     
     # Print summary
-    total_relationships = sum(
-        len(term.synonyms) + len(term.antonyms) + len(term.related_terms) +
-        len(term.preferred_terms) + len(term.replacement_terms) + len(term.see_also) +
-        len(term.is_a) + len(term.classifies)
-        for term in terms.values()
-    )
-    
-    click.echo(f"\n📊 API CALL SUMMARY:")
-    click.echo(f"  • Glossary Creation Calls: {len(glossaries)}")
-    click.echo(f"  • Category Creation Calls: {len(categories)}")
-    click.echo(f"  • Term Batch Creation Calls: {len(terms_by_glossary)}")
+    print(f"\n📊 API CALL SUMMARY:", file=buf)
+    print(f"  • Glossary Creation Calls: {stats.glossary_count}", file=buf)
+    print(f"  • Category Creation Calls: {stats.category_count}", file=buf)
+    print(f"  • Term Batch Creation Calls: {len(terms_by_glossary)}", file=buf)
     if not exclude_relationships:
-        click.echo(f"  • Relationship Update Calls: {sum(1 for t in terms.values() if any([t.synonyms, t.antonyms, t.related_terms, t.preferred_terms, t.replacement_terms, t.see_also, t.is_a, t.classifies]))}")
-        click.echo(f"  • Total Relationship Records: {total_relationships}")
+        print(f"  • Relationship Update Calls: {stats.related_term_count}", file=buf)
+        print(f"  • Total Relationship Records: {stats.relationship_count}", file=buf)
     
-    click.echo()
+    print(file=buf)
+    click.echo(buf.getvalue(), nl=False)
 
 
-def _print_dry_run_report(glossaries, categories, terms, warnings, exclude_relationships):
-    """Print dry-run validation report"""
-    click.echo("\n" + "=" * 80)
-    click.echo("DRY-RUN VALIDATION REPORT")
-    click.echo("=" * 80)
+def _print_dry_run_report(glossaries, categories, terms, warnings, exclude_relationships, stats):
+    """Print dry-run validation report from pre-sorted glossaries, categories, terms and warnings"""
+    buf = io.StringIO()
+    
+    print("\n" + "=" * 80, file=buf)
+    print("DRY-RUN VALIDATION REPORT", file=buf)
+    print("=" * 80, file=buf)
     
     # Glossaries
-    click.echo(f"\n📚 GLOSSARIES ({len(glossaries)}):")
-    for name in sorted(glossaries.keys()):
-        click.echo(f"  ✓ {name}")
+    print(f"\n📚 GLOSSARIES ({stats.glossary_count}):", file=buf)
+    for name in glossaries:
+        print(f"  ✓ {name}", file=buf)
     
     # Categories
-    click.echo(f"\n📁 CATEGORIES ({len(categories)}):")
-    for (glossary, name), cat in sorted(categories.items()):
+    print(f"\n📁 CATEGORIES ({stats.category_count}):", file=buf)
+    for (glossary, name), cat in categories:
         parent_str = f" (parent: {cat.parent_category_name})" if cat.parent_category_name else ""
-        click.echo(f"  ✓ {glossary}.{name}{parent_str}")
+        print(f"  ✓ {glossary}.{name}{parent_str}", file=buf)
         if cat.short_description:
-            click.echo(f"    └─ {cat.short_description}")
+            print(f"    └─ {cat.short_description}", file=buf)
     
     # Terms with detailed information
-    click.echo(f"\n📝 TERMS ({len(terms)}):")
-    for (glossary, name), term in sorted(terms.items()):
-        click.echo(f"  ✓ {glossary}.{name}")
+    print(f"\n📝 TERMS ({stats.term_count}):", file=buf)
+    for (glossary, name), term in terms:
+        print(f"  ✓ {glossary}.{name}", file=buf)
         
         # Basic information
         if term.abbreviation:
-            click.echo(f"    ├─ Abbreviation: {term.abbreviation}")
+            print(f"    ├─ Abbreviation: {term.abbreviation}", file=buf)
         if term.short_description:
-            click.echo(f"    ├─ Description: {term.short_description}")
+            print(f"    ├─ Description: {term.short_description}", file=buf)
         if term.long_description:
-            click.echo(f"    ├─ Details: {term.long_description}")
+            print(f"    ├─ Details: {term.long_description}", file=buf)
         if term.steward:
-            click.echo(f"    ├─ Steward: {term.steward}")
+            print(f"    ├─ Steward: {term.steward}", file=buf)
         if term.status:
-            click.echo(f"    ├─ Status: {term.status}")
+            print(f"    ├─ Status: {term.status}", file=buf)
         if term.examples:
-            click.echo(f"    ├─ Examples: {term.examples}")
+            print(f"    ├─ Examples: {term.examples}", file=buf)
         if term.category_names:
-            click.echo(f"    ├─ Categories: {', '.join(term.category_names)}")
+            print(f"    ├─ Categories: {', '.join(term.category_names)}", file=buf)
         
         # Show relationships
         if not exclude_relationships:
-            all_rels = [
-                ("Synonyms", term.synonyms),
-                ("Antonyms", term.antonyms),
-                ("Related Terms", term.related_terms),
-                ("Preferred Terms", term.preferred_terms),
-                ("Replacement Terms", term.replacement_terms),
-                ("See Also", term.see_also),
-                ("Is A", term.is_a),
-                ("Classifies", term.classifies),
-            ]
+            all_rels = [(label, getattr(term, attr)) for label, attr in _REL_LABELS]
             
-            has_relationships = any(rel_list for _, rel_list in all_rels)
-            if has_relationships:
-                click.echo(f"    └─ Relationships:")
-                for rel_type, rel_list in all_rels:
+            # The tree closes on the last target of the last non-empty relationship type
+            last_nonempty_idx = max((idx for idx, (_, rel_list) in enumerate(all_rels) if rel_list), default=-1)
+            if last_nonempty_idx >= 0:
+                print(f"    └─ Relationships:", file=buf)
+                for idx, (rel_type, rel_list) in enumerate(all_rels):
                     if rel_list:
+                        last_i = len(rel_list) - 1 if idx == last_nonempty_idx else -1
                         for i, rel_target in enumerate(rel_list):
-                            is_last = (i == len(rel_list) - 1) and all(
-                                not rel_list2 for _, rel_list2 in all_rels[all_rels.index((rel_type, rel_list))+1:]
-                            )
-                            prefix = "       └─ " if is_last else "       ├─ "
-                            click.echo(f"{prefix}{rel_type}: {rel_target}")
+                            prefix = "       └─ " if i == last_i else "       ├─ "
+                            print(f"{prefix}{rel_type}: {rel_target}", file=buf)
     
-    # Summary statistics
-    total_relationships = sum(
-        len(term.synonyms) + len(term.antonyms) + len(term.related_terms) +
-        len(term.preferred_terms) + len(term.replacement_terms) + len(term.see_also) +
-        len(term.is_a) + len(term.classifies)
-        for term in terms.values()
-    )
+    buf.write(_format_summary(stats, warnings, exclude_relationships))
+    click.echo(buf.getvalue(), nl=False)
+
+
+def _format_summary(stats, warnings, exclude_relationships):
+    """Format the summary counts and validation warnings that close the dry-run report"""
+    buf = io.StringIO()
     
-    click.echo(f"\n📊 SUMMARY:")
-    click.echo(f"  • Glossaries: {len(glossaries)}")
-    click.echo(f"  • Categories: {len(categories)}")
-    click.echo(f"  • Terms: {len(terms)}")
+    # Summary statistics
+    print(f"\n📊 SUMMARY:", file=buf)
+    print(f"  • Glossaries: {stats.glossary_count}", file=buf)
+    print(f"  • Categories: {stats.category_count}", file=buf)
+    print(f"  • Terms: {stats.term_count}", file=buf)
     if not exclude_relationships:
-        click.echo(f"  • Relationships: {total_relationships}")
+        print(f"  • Relationships: {stats.relationship_count}", file=buf)
     else:
-        click.echo(f"  • Relationships: 0 (excluded)")
+        print(f"  • Relationships: 0 (excluded)", file=buf)
     
     # Validation warnings
     if warnings:
-        click.echo(f"\n⚠️  VALIDATION WARNINGS ({len(warnings)}):")
-        for warning in sorted(warnings):
-            click.echo(f"  ⚠️  {warning}")
+        print(f"\n⚠️  VALIDATION WARNINGS ({len(warnings)}):", file=buf)
+        for warning in warnings:
+            print(f"  ⚠️  {warning}", file=buf)
     else:
-        click.echo(f"\n✅ All validations passed!")
+        print(f"\n✅ All validations passed!", file=buf)
     
-    click.echo("\n" + "=" * 80)
+    print("\n" + "=" * 80, file=buf)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
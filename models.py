@@ -1,8 +1,29 @@
 """Data models for Atlas business glossary entities"""
 
+import functools
+import re
 from dataclasses import dataclass, field
-from typing import Optional, List
+from sys import intern
+from typing import Dict, Iterator, Optional, List, Sequence, Tuple
 from enum import Enum
+from itertools import chain
+from operator import attrgetter
+
+
+# Qualified term names look like "glossary.termname@glossary"; the glossary is
+# the first dotted part and the term name the last one before the realm
+_QUALIFIED_NAME_RE = re.compile(r"^([^.@]+)\.(?:.*\.)?([^.@]+)@")
+
+
+# Unbounded: the distinct names are limited to the terms of one import, and a
+# bounded LRU would evict everything once a large glossary cycles past its size
+@functools.lru_cache(maxsize=None)
+def parse_qualified_name(qualified_name: str) -> Optional[Tuple[str, str]]:
+    """Parse a qualified term name into a (glossary, term name) key"""
+    match = _QUALIFIED_NAME_RE.match(qualified_name)
+    if not match:
+        return None
+    return match.group(1), match.group(2)
 
 
 class EntityType(str, Enum):
@@ -24,7 +45,27 @@ class RelationshipType(str, Enum):
     CLASSIFIES = "classifies"
 
 
-@dataclass
+# (Atlas payload field, Term attribute) holding each relationship type's targets,
+# in payload order; everything that walks a term's relationship lists derives from this
+TERM_RELATIONSHIP_FIELDS: Dict[RelationshipType, Tuple[str, str]] = {
+    RelationshipType.SYNONYM: ("synonyms", "synonyms"),
+    RelationshipType.ANTONYM: ("antonyms", "antonyms"),
+    RelationshipType.RELATED_TERM: ("relatedTerms", "related_terms"),
+    RelationshipType.PREFERRED_TERM: ("preferredTerms", "preferred_terms"),
+    RelationshipType.REPLACEMENT_TERM: ("replacementTerms", "replacement_terms"),
+    RelationshipType.SEE_ALSO: ("seeAlso", "see_also"),
+    RelationshipType.IS_A: ("isA", "is_a"),
+    RelationshipType.CLASSIFIES: ("classifies", "classifies"),
+}
+
+# The (payload field, Term attribute) pairs alone, for code that walks every list
+RELATIONSHIP_FIELD_PAIRS: Tuple[Tuple[str, str], ...] = tuple(TERM_RELATIONSHIP_FIELDS.values())
+
+# Reads all of a term's relationship lists in a single C-level call
+relationship_lists = attrgetter(*(attr for _, attr in RELATIONSHIP_FIELD_PAIRS))
+
+
+@dataclass(slots=True)
 class Glossary:
     """Business glossary entity"""
     name: str
@@ -39,7 +80,7 @@ class Glossary:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     """Glossary category entity"""
     name: str
@@ -49,15 +90,28 @@ class Category:
     long_description: Optional[str] = None
     status: str = "Active"
     guid: Optional[str] = None
+    _hash: int = field(init=False, repr=False, compare=False)
+    _qualified_name: str = field(init=False, repr=False, compare=False)
     
-    def qualified_name(self) -> str:
-        """Generate qualified name for category"""
+    def __post_init__(self):
+        # Names and status repeat across many rows, so share one string object each
+        self.name = intern(self.name)
+        self.glossary_name = intern(self.glossary_name)
+        self.status = intern(self.status)
+        # Identity is (glossary_name, name), which never changes after parsing
+        self._hash = hash((self.glossary_name, self.name))
         if self.parent_category_name:
-            return f"{self.glossary_name}.{self.parent_category_name}.{self.name}@glossary"
-        return f"{self.glossary_name}.{self.name}@glossary"
+            self._qualified_name = f"{self.glossary_name}.{self.parent_category_name}.{self.name}@glossary"
+        else:
+            self._qualified_name = f"{self.glossary_name}.{self.name}@glossary"
+    
+    @property
+    def qualified_name(self) -> str:
+        """Qualified name for category"""
+        return self._qualified_name
     
     def __hash__(self):
-        return hash((self.glossary_name, self.name))
+        return self._hash
     
     def __eq__(self, other):
         if isinstance(other, Category):
@@ -65,7 +119,7 @@ class Category:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Term:
     """Glossary term entity"""
     name: str
@@ -78,21 +132,50 @@ class Term:
     abbreviation: Optional[str] = None
     examples: Optional[str] = None
     guid: Optional[str] = None
-    synonyms: List[str] = field(default_factory=list)
-    antonyms: List[str] = field(default_factory=list)
-    related_terms: List[str] = field(default_factory=list)
-    preferred_terms: List[str] = field(default_factory=list)
-    replacement_terms: List[str] = field(default_factory=list)
-    see_also: List[str] = field(default_factory=list)
-    is_a: List[str] = field(default_factory=list)
-    classifies: List[str] = field(default_factory=list)
+    # Relationship targets share the empty tuple until the graph builder
+    # gives a term its first target of that type; non-empty values are
+    # turned into lists in __post_init__
+    synonyms: Sequence[str] = ()
+    antonyms: Sequence[str] = ()
+    related_terms: Sequence[str] = ()
+    preferred_terms: Sequence[str] = ()
+    replacement_terms: Sequence[str] = ()
+    see_also: Sequence[str] = ()
+    is_a: Sequence[str] = ()
+    classifies: Sequence[str] = ()
+    _hash: int = field(init=False, repr=False, compare=False)
+    _qualified_name: str = field(init=False, repr=False, compare=False)
     
+    def __post_init__(self):
+        # Names, status, steward and category names repeat across many rows,
+        # so share one string object each
+        self.name = intern(self.name)
+        self.glossary_name = intern(self.glossary_name)
+        self.status = intern(self.status)
+        if self.steward:
+            self.steward = intern(self.steward)
+        self.category_names = [intern(cat) for cat in self.category_names]
+        # Targets passed in become the term's own lists, which the graph builder appends to
+        if any(relationship_lists(self)):
+            for _, attr in RELATIONSHIP_FIELD_PAIRS:
+                refs = getattr(self, attr)
+                if refs and not isinstance(refs, list):
+                    setattr(self, attr, list(refs))
+        # Identity is (glossary_name, name), which never changes after parsing
+        self._hash = hash((self.glossary_name, self.name))
+        self._qualified_name = f"{self.glossary_name}.{self.name}@glossary"
+    
+    @property
     def qualified_name(self) -> str:
-        """Generate qualified name for term"""
-        return f"{self.glossary_name}.{self.name}@glossary"
+        """Qualified name for term"""
+        return self._qualified_name
+    
+    def iter_all_refs(self) -> Iterator[str]:
+        """Iterate the qualified names of every relationship target without copying the lists"""
+        return chain.from_iterable(relationship_lists(self))
     
     def __hash__(self):
-        return hash((self.glossary_name, self.name))
+        return self._hash
     
     def __eq__(self, other):
         if isinstance(other, Term):
@@ -100,7 +183,7 @@ class Term:
         return False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Relationship:
     """Relationship between two terms"""
     source_glossary: str
@@ -109,12 +192,37 @@ class Relationship:
     target_name: str
     relationship_type: RelationshipType
     is_bidirectional: bool = False
+    target_key: Tuple[str, str] = field(init=False, repr=False, compare=False)
+    target_ref: str = field(init=False, repr=False, compare=False)
     
-    def __hash__(self):
-        return hash((
-            self.source_glossary,
-            self.source_name,
-            self.target_glossary,
-            self.target_name,
-            self.relationship_type,
-        ))
+    def __post_init__(self):
+        # Resolved once so the graph builder neither formats nor re-parses the target
+        object.__setattr__(self, "target_key", (self.target_glossary, self.target_name))
+        # Interned because every relationship into the same term repeats it in a term list
+        object.__setattr__(self, "target_ref", intern(f"{self.target_glossary}.{self.target_name}@glossary"))
+
+
+@dataclass(slots=True)
+class SummaryStats:
+    """Entity and relationship counts shown in the import reports"""
+    glossary_count: int
+    category_count: int
+    term_count: int
+    relationship_count: int = 0
+    related_term_count: int = 0
+    
+    @classmethod
+    def from_collections(
+        cls,
+        glossaries: Dict[str, Glossary],
+        categories: Dict[Tuple[str, str], Category],
+        terms: Dict[Tuple[str, str], Term],
+    ) -> "SummaryStats":
+        """Count the collections, walking the terms' relationship lists once"""
+        stats = cls(len(glossaries), len(categories), len(terms))
+        for term in terms.values():
+            count = sum(map(len, relationship_lists(term)))
+            if count:
+                stats.relationship_count += count
+                stats.related_term_count += 1
+        return stats
@@ -1,106 +1,246 @@
 """Relationship graph builder for Atlas glossary terms"""
 
 import logging
-from typing import Dict, Tuple, Set
-from models import Term, Relationship, RelationshipType
+from math import isqrt
+from typing import Dict, FrozenSet, Iterator, List, Tuple, Set
+from models import Category, Term, RelationshipType, TERM_RELATIONSHIP_FIELDS, parse_qualified_name
 
 logger = logging.getLogger(__name__)
 
+# Hierarchical relationship types, which must not loop back on themselves
+_ACYCLIC_TYPES = (RelationshipType.IS_A, RelationshipType.CLASSIFIES)
+
+# Fewest terms a per-edge cycle check may visit before it defers to a full pass
+_MIN_CYCLE_CHECK = 64
+
+
+def build_category_tree(
+    categories: Dict[Tuple[str, str], Category]
+) -> Tuple[List[Tuple[str, str]], Dict[Tuple[str, str], List[Tuple[str, str]]]]:
+    """Return the root category keys and the child keys of every parent"""
+    children: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+    roots: List[Tuple[str, str]] = []
+    for key, category in categories.items():
+        if not category.parent_category_name:
+            roots.append(key)
+            continue
+        
+        parent_key = (key[0], category.parent_category_name)
+        if parent_key not in categories:
+            logger.error(f"Parent category not found: {key[0]}.{category.parent_category_name}")
+            raise Exception(f"Parent category not found: {key[0]}.{category.parent_category_name}")
+        children.setdefault(parent_key, []).append(key)
+    
+    # Every category has at most one parent, so anything not reachable
+    # from a root is part of a cycle
+    reached = 0
+    level = roots
+    while level:
+        reached += len(level)
+        level = [child for key in level for child in children.get(key, ())]
+    
+    if reached != len(categories):
+        raise Exception("Cycle detected in category hierarchy")
+    
+    return roots, children
+
+
+def order_categories(categories: Dict[Tuple[str, str], Category]) -> List[Tuple[str, str]]:
+    """Return category keys in creation order: parents first, siblings by name"""
+    roots, children = build_category_tree(categories)
+    
+    # The hierarchy is a forest, so a breadth-first walk is already a
+    # topological order and each category is visited exactly once
+    order = sorted(roots)
+    for key in order:
+        order.extend(sorted(children.get(key, ())))
+    return order
+
 
 class RelationshipGraphBuilder:
     """Build and manage relationships between terms"""
     
+    # Term attribute holding each relationship type's targets
+    _ATTR_BY_TYPE = {rel_type: attr for rel_type, (_, attr) in TERM_RELATIONSHIP_FIELDS.items()}
+    
     def __init__(self, terms: Dict[Tuple[str, str], Term]):
         self.terms = terms
+        self._hierarchy: Dict[RelationshipType, Dict[Tuple[str, str], Set[Tuple[str, str]]]] = {}
+        self._cycle_warnings: Set[str] = set()
+        # Types with an edge whose cycle check hit its bound, left to one full pass
+        self._unchecked: Set[RelationshipType] = set()
+        # (source key, type, target key) of every relationship already added, so
+        # duplicates are rejected by hash lookup instead of scanning the term's list
+        self._applied: Set[Tuple[Tuple[str, str], RelationshipType, Tuple[str, str]]] = set()
+        # Reverse index: target key -> (source key, type) of every relationship pointing at it
+        self._incoming: Dict[Tuple[str, str], List[Tuple[Tuple[str, str], RelationshipType]]] = {}
+        # Qualified name -> (glossary, name) of every target, so the client never has
+        # to split names back apart (glossary and term names may contain dots)
+        self.target_keys: Dict[str, Tuple[str, str]] = {}
+        self._index_existing_targets()
+    
+    def _index_existing_targets(self) -> None:
+        """Record targets terms were built with, so applying them again is a duplicate"""
+        for source_key, term in self.terms.items():
+            if not any(term.iter_all_refs()):
+                continue
+            for rel_type, attr in self._ATTR_BY_TYPE.items():
+                for target_ref in getattr(term, attr):
+                    target_key = parse_qualified_name(target_ref)
+                    edge = (source_key, rel_type, target_key)
+                    if target_key is None or edge in self._applied:
+                        continue
+                    self._applied.add(edge)
+                    self._incoming.setdefault(target_key, []).append((source_key, rel_type))
+                    self.target_keys.setdefault(target_ref, target_key)
     
     def apply_relationships(self, relationships: list) -> None:
         """Apply relationships to terms"""
         logger.info(f"Applying {len(relationships)} relationships to terms")
         
+        # Check every source term up front so the apply loop needs no error handling,
+        # and report all missing sources at once instead of only the first
+        terms = self.terms
+        missing = sorted({
+            f"{rel.source_glossary}.{rel.source_name}"
+            for rel in relationships
+            if (rel.source_glossary, rel.source_name) not in terms
+        })
+        if missing:
+            for source in missing:
+                logger.error(f"Failed to apply relationship: Source term not found: {source}")
+            label = "Source term" if len(missing) == 1 else "Source terms"
+            raise ValueError(f"{label} not found: {', '.join(missing)}")
+        
+        # The loop is specialized once per call: lookups that do not depend on the
+        # relationship are bound to locals and the debug check is made up front
+        applied = self._applied
+        incoming = self._incoming
+        target_keys = self.target_keys
+        attr_by_type = self._ATTR_BY_TYPE
+        add_hierarchy_edge = self._add_hierarchy_edge
+        debug = logger.isEnabledFor(logging.DEBUG)
         for rel in relationships:
-            try:
-                self._apply_relationship(rel)
-            except Exception as e:
-                logger.error(f"Failed to apply relationship: {str(e)}")
-                raise
+            source_key = (rel.source_glossary, rel.source_name)
+            rel_type = rel.relationship_type
+            target_key = rel.target_key
+            
+            # Add relationship to source term based on type, once per distinct target
+            edge = (source_key, rel_type, target_key)
+            if edge not in applied:
+                applied.add(edge)
+                incoming.setdefault(target_key, []).append((source_key, rel_type))
+                target_keys[rel.target_ref] = target_key
+                source_term = terms[source_key]
+                attr = attr_by_type[rel_type]
+                bucket = getattr(source_term, attr)
+                if bucket:
+                    bucket.append(rel.target_ref)
+                else:
+                    # Replace the shared empty default with the term's own list
+                    setattr(source_term, attr, [rel.target_ref])
+            
+            if rel_type in _ACYCLIC_TYPES:
+                add_hierarchy_edge(rel_type, source_key, target_key)
+            
+            if debug:
+                logger.debug("Applied %s from %s to %s", rel_type.value, source_key, rel.target_ref)
     
-    def _apply_relationship(self, rel: Relationship) -> None:
-        """Apply a single relationship"""
-        # Find source term
-        source_key = (rel.source_glossary, rel.source_name)
-        if source_key not in self.terms:
-            raise ValueError(
-                f"Source term not found: {rel.source_glossary}.{rel.source_name}"
-            )
-        
-        source_term = self.terms[source_key]
-        
-        # Create target term reference (qualified name)
-        target_ref = f"{rel.target_glossary}.{rel.target_name}@glossary"
+    def _add_hierarchy_edge(
+        self,
+        rel_type: RelationshipType,
+        source_key: Tuple[str, str],
+        target_key: Tuple[str, str]
+    ) -> None:
+        """Record a hierarchical edge and warn if it closes a cycle"""
+        edges = self._hierarchy.setdefault(rel_type, {})
+        targets = edges.setdefault(source_key, set())
+        if target_key in targets:
+            return
+        targets.add(target_key)
         
-        # Add relationship to source term based on type
-        if rel.relationship_type == RelationshipType.SYNONYM:
-            if target_ref not in source_term.synonyms:
-                source_term.synonyms.append(target_ref)
-        elif rel.relationship_type == RelationshipType.ANTONYM:
-            if target_ref not in source_term.antonyms:
-                source_term.antonyms.append(target_ref)
-        elif rel.relationship_type == RelationshipType.RELATED_TERM:
-            if target_ref not in source_term.related_terms:
-                source_term.related_terms.append(target_ref)
-        elif rel.relationship_type == RelationshipType.PREFERRED_TERM:
-            if target_ref not in source_term.preferred_terms:
-                source_term.preferred_terms.append(target_ref)
-        elif rel.relationship_type == RelationshipType.REPLACEMENT_TERM:
-            if target_ref not in source_term.replacement_terms:
-                source_term.replacement_terms.append(target_ref)
-        elif rel.relationship_type == RelationshipType.SEE_ALSO:
-            if target_ref not in source_term.see_also:
-                source_term.see_also.append(target_ref)
-        elif rel.relationship_type == RelationshipType.IS_A:
-            if target_ref not in source_term.is_a:
-                source_term.is_a.append(target_ref)
-        elif rel.relationship_type == RelationshipType.CLASSIFIES:
-            if target_ref not in source_term.classifies:
-                source_term.classifies.append(target_ref)
-        
-        logger.debug(
-            f"Applied {rel.relationship_type.value} from "
-            f"{source_key} to {target_ref}"
+        # The graph had no cycle before this edge, so it closes one only if the
+        # source is reachable from the target; only that part of the graph is walked,
+        # and only up to about sqrt(edges) terms so long chains stay subquadratic
+        limit = max(_MIN_CYCLE_CHECK, isqrt(len(self._applied)))
+        stack = [target_key]
+        seen = {target_key}
+        while stack:
+            key = stack.pop()
+            if key == source_key:
+                self._add_cycle_warning(rel_type, source_key, target_key)
+                # Drop the edge so later checks keep walking an acyclic graph
+                targets.discard(target_key)
+                return
+            for next_key in edges.get(key, ()):
+                if next_key not in seen:
+                    if len(seen) >= limit:
+                        # Too deep to settle here; keep the edge and check the whole graph once
+                        self._unchecked.add(rel_type)
+                        return
+                    seen.add(next_key)
+                    stack.append(next_key)
+    
+    def _add_cycle_warning(
+        self,
+        rel_type: RelationshipType,
+        source_key: Tuple[str, str],
+        target_key: Tuple[str, str]
+    ) -> None:
+        """Record a warning for the edge that closes a cycle"""
+        self._cycle_warnings.add(
+            f"Cycle detected in {rel_type.value} relationships: "
+            f"{source_key[0]}.{source_key[1]} -> {target_key[0]}.{target_key[1]}"
         )
     
-    def validate_all_relationships(self) -> Set[str]:
-        """Validate all relationships and return warnings"""
-        warnings = set()
-        
-        for (glossary, name), term in self.terms.items():
-            all_refs = (
-                term.synonyms + term.antonyms + term.related_terms +
-                term.preferred_terms + term.replacement_terms + term.see_also +
-                term.is_a + term.classifies
-            )
-            
-            for ref in all_refs:
-                # Extract glossary and term name from qualified name
-                parts = ref.split("@")
-                if len(parts) != 2 or parts[1] != "glossary":
-                    warnings.add(f"Invalid qualified name: {ref}")
+    def _check_deferred_cycles(self) -> None:
+        """Find the cycles left by bounded checks with one iterative DFS per deferred type"""
+        for rel_type in self._unchecked:
+            edges = self._hierarchy[rel_type]
+            # 1 while a term is on the DFS path, 2 once all its targets are done
+            state: Dict[Tuple[str, str], int] = {}
+            for root in sorted(edges):
+                if root in state:
                     continue
-                
-                qualified = parts[0]
-                glossary_term_parts = qualified.split(".")
-                if len(glossary_term_parts) < 2:
-                    warnings.add(f"Invalid qualified name format: {ref}")
-                    continue
-                
-                ref_glossary = glossary_term_parts[0]
-                ref_name = glossary_term_parts[-1]
-                
-                target_key = (ref_glossary, ref_name)
-                if target_key not in self.terms:
-                    warnings.add(
-                        f"Relationship target not found: {glossary}.{name} "
-                        f"-> {ref}"
-                    )
+                state[root] = 1
+                path = [(root, iter(sorted(edges[root])))]
+                while path:
+                    key, targets = path[-1]
+                    for target_key in targets:
+                        target_state = state.get(target_key)
+                        if target_state == 1:
+                            # An edge back onto the path closes a cycle; drop it as on insert
+                            self._add_cycle_warning(rel_type, key, target_key)
+                            edges[key].discard(target_key)
+                        elif target_state is None:
+                            state[target_key] = 1
+                            path.append((target_key, iter(sorted(edges.get(target_key, ())))))
+                            break
+                    else:
+                        state[key] = 2
+                        path.pop()
+        self._unchecked.clear()
+    
+    def iter_validation_warnings(self) -> Iterator[str]:
+        """Yield each relationship validation warning once, as it is found"""
+        if self._unchecked:
+            self._check_deferred_cycles()
+        yield from self._cycle_warnings
         
-        return warnings
+        # Targets are indexed by key as they are applied, so the missing ones fall
+        # out of a single set difference and only their incoming edges are visited.
+        # A source may point at the same target with several types, which share a message
+        for target_key in self._incoming.keys() - self.terms.keys():
+            reported: Set[Tuple[str, str]] = set()
+            for source_key, _ in self._incoming[target_key]:
+                if source_key in reported:
+                    continue
+                reported.add(source_key)
+                yield (
+                    f"Relationship target not found: {source_key[0]}.{source_key[1]} "
+                    f"-> {target_key[0]}.{target_key[1]}@glossary"
+                )
+    
+    def validate_all_relationships(self) -> FrozenSet[str]:
+        """Validate all relationships and return warnings"""
+        return frozenset(self.iter_validation_warnings())
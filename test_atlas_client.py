@@ -0,0 +1,102 @@
+"""Tests for AtlasClient's lookups of existing glossary content"""
+
+import unittest
+from typing import List
+from atlas_client import AtlasClient
+from models import Term, Relationship, RelationshipType
+from relationship_graph import RelationshipGraphBuilder
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+    
+    def __init__(self, status_code: int, data):
+        self.status_code = status_code
+        self._data = data
+    
+    def json(self):
+        return self._data
+
+
+class FakeSession:
+    """Record GET URLs and answer them with a fixed listing"""
+    
+    def __init__(self, data: List[dict]):
+        self.data = data
+        self.urls: List[str] = []
+    
+    def get(self, url, params=None, **kwargs):
+        self.urls.append(url)
+        return FakeResponse(200, self.data)
+    
+    def close(self):
+        pass
+
+
+class ExistingContentLookupTest(unittest.TestCase):
+    """The per-glossary collection endpoints are addressed by glossary GUID"""
+    
+    def setUp(self):
+        self.client = AtlasClient("http://atlas.example", "user", "password", max_workers=1)
+        self.addCleanup(self.client.close)
+    
+    def test_category_lookup_requests_glossary_guid(self):
+        session = FakeSession([{"name": "Metrics", "guid": "cat-guid"}])
+        self.client.session = session
+        
+        guid = self.client._get_category_guid_by_name("Sales", "gloss-guid", "Metrics")
+        
+        self.assertEqual(guid, "cat-guid")
+        self.assertEqual(session.urls, ["http://atlas.example/api/atlas/v2/glossary/gloss-guid/categories"])
+    
+    def test_term_lookup_requests_glossary_guid(self):
+        session = FakeSession([{"name": "Revenue", "guid": "term-guid"}])
+        self.client.session = session
+        
+        terms = self.client._get_glossary_terms("Sales", "gloss-guid")
+        
+        self.assertEqual(terms, {"Revenue": "term-guid"})
+        self.assertEqual(session.urls, ["http://atlas.example/api/atlas/v2/glossary/gloss-guid/terms"])
+    
+    def test_paging_stops_when_offset_is_ignored(self):
+        session = FakeSession([{"name": f"Term {i}", "guid": f"guid-{i}"} for i in range(1000)])
+        self.client.session = session
+        
+        index = self.client._fetch_name_index("http://atlas.example/listing")
+        
+        self.assertEqual(len(index), 1000)
+        self.assertEqual(len(session.urls), 2)
+
+
+
+class RelationshipTargetTest(unittest.TestCase):
+    """Relationship targets resolve to the keys the graph builder applied"""
+    
+    def setUp(self):
+        self.client = AtlasClient("http://atlas.example", "user", "password", max_workers=1)
+        self.addCleanup(self.client.close)
+    
+    def test_dotted_glossary_name_resolves(self):
+        terms = {
+            ("Sales.EU", "Revenue"): Term(name="Revenue", glossary_name="Sales.EU"),
+            ("Sales.EU", "Income"): Term(name="Income", glossary_name="Sales.EU"),
+        }
+        builder = RelationshipGraphBuilder(terms)
+        builder.apply_relationships([
+            Relationship("Sales.EU", "Revenue", "Sales.EU", "Income", RelationshipType.IS_A),
+        ])
+        term_guid_map = {("Sales.EU", "Revenue"): "revenue-guid", ("Sales.EU", "Income"): "income-guid"}
+        
+        self.assertEqual(builder.validate_all_relationships(), frozenset())
+        self.assertEqual(
+            self.client._build_term_refs(terms, term_guid_map, builder.target_keys),
+            {"Sales.EU.Income@glossary": {"termGuid": "income-guid", "displayName": "Income"}},
+        )
+        self.assertEqual(
+            self.client._resolve_term_guid("Sales.EU.Income@glossary", term_guid_map, builder.target_keys),
+            "income-guid",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Tests for RelationshipGraphBuilder"""
+
+import unittest
+from models import Term, Relationship, RelationshipType
+from relationship_graph import RelationshipGraphBuilder
+
+
+def _chain(length: int):
+    """Return terms g.t0 .. g.t<length - 1> and is_a edges linking each to the next, bottom-up"""
+    terms = {("g", f"t{i}"): Term(name=f"t{i}", glossary_name="g") for i in range(length)}
+    relationships = [
+        Relationship("g", f"t{i}", "g", f"t{i + 1}", RelationshipType.IS_A)
+        for i in reversed(range(length - 1))
+    ]
+    return terms, relationships
+
+
+class HierarchyCycleTest(unittest.TestCase):
+    """Cycles are reported whether or not the per-edge check reaches its bound"""
+    
+    def test_short_cycle_found_on_insert(self):
+        terms, relationships = _chain(10)
+        relationships.append(Relationship("g", "t9", "g", "t0", RelationshipType.IS_A))
+        builder = RelationshipGraphBuilder(terms)
+        builder.apply_relationships(relationships)
+        
+        self.assertEqual(
+            builder.validate_all_relationships(),
+            {"Cycle detected in is_a relationships: g.t9 -> g.t0"},
+        )
+    
+    def test_long_cycle_found_by_deferred_pass(self):
+        terms, relationships = _chain(500)
+        relationships.append(Relationship("g", "t499", "g", "t0", RelationshipType.IS_A))
+        builder = RelationshipGraphBuilder(terms)
+        builder.apply_relationships(relationships)
+        
+        self.assertEqual(
+            builder.validate_all_relationships(),
+            {"Cycle detected in is_a relationships: g.t499 -> g.t0"},
+        )
+    
+    def test_long_chain_without_cycle(self):
+        terms, relationships = _chain(500)
+        builder = RelationshipGraphBuilder(terms)
+        builder.apply_relationships(relationships)
+        
+        self.assertEqual(builder.validate_all_relationships(), frozenset())
+
+
+if __name__ == "__main__":
+    unittest.main()